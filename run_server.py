@@ -3,44 +3,89 @@
 
 import os
 import sys
+import json
 import sqlite3
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from itertools import chain
 from pathlib import Path
 
+# Righe per singolo INSERT multi-VALUES (3 parametri per riga, sotto il
+# limite storico SQLITE_MAX_VARIABLE_NUMBER di 999)
+INSERT_BATCH_ROWS = 300
+
+
+class SimpleHandler(BaseHTTPRequestHandler):
+    """Handler HTTP minimale usato quando FastAPI non è disponibile."""
+
+    def do_GET(self):
+        if self.path == '/':
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.end_headers()
+            response = {
+                "message": "Speech-to-Phrase Validator",
+                "status": "running",
+                "version": "0.3.0",
+                "mode": "simple_fallback"
+            }
+            self.wfile.write(json.dumps(response).encode())
+        elif self.path == '/health':
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.end_headers()
+            self.wfile.write(b'{"status": "ok"}')
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        sys.stdout.write(f"[{self.log_date_time_string()}] {format % args}\n")
+
+
+def run_simple_server(port: int = 8099):
+    """Avvia il server HTTP minimale di fallback (solo libreria standard)."""
+    print(f"Starting simple HTTP server on port {port}...")
+    server = HTTPServer(('0.0.0.0', port), SimpleHandler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+        server.server_close()
+
+
 def create_mock_data():
     """Crea dati mock per il test."""
-    print("📋 Creazione dati mock per test...")
-
     # Crea struttura directory mock
     base_dir = Path("mock_data")
     models_dir = base_dir / "models" / "en_US-rhasspy"
     train_dir = base_dir / "train" / "en_US-rhasspy"
     tools_dir = base_dir / "tools"
+    kaldi_model_dir = models_dir / "model" / "model"
+    phones_dir = models_dir / "model" / "phones"
+    db_path = phones_dir / "lexicon.db"
 
-    # Crea directories
-    for dir_path in [models_dir, train_dir, tools_dir]:
-        dir_path.mkdir(parents=True, exist_ok=True)
+    # Dati mock già presenti: salta il setup (idempotente) nei riavvii
+    if (kaldi_model_dir / "final.mdl").exists() and db_path.exists():
+        print(f"📁 Dati mock già presenti in: {base_dir.absolute()}")
+        return str(models_dir.parent), str(train_dir.parent), str(tools_dir)
 
-    # Crea file mock del modello Kaldi
-    (models_dir / "model" / "model").mkdir(parents=True, exist_ok=True)
-    (models_dir / "model" / "model" / "final.mdl").touch()
-    (models_dir / "g2p.fst").touch()
+    print("📋 Creazione dati mock per test...")
 
-    # Crea database lessico mock
-    phones_dir = models_dir / "model" / "phones"
-    phones_dir.mkdir(parents=True, exist_ok=True)
+    # Crea solo le directory foglia (i genitori vengono creati con loro)
+    for dir_path in [train_dir, tools_dir, kaldi_model_dir, phones_dir]:
+        os.makedirs(dir_path, exist_ok=True)
+
+    # Crea file mock del modello Kaldi (se mancanti)
+    for file_path in [kaldi_model_dir / "final.mdl", models_dir / "g2p.fst"]:
+        if not os.path.isfile(file_path):
+            open(file_path, "ab").close()
 
     # Crea un database SQLite mock con parole italiane e inglesi
-    db_path = phones_dir / "lexicon.db"
     if not db_path.exists():
-        conn = sqlite3.connect(str(db_path))
-
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS word_phonemes (
-                word TEXT,
-                phonemes TEXT,
-                pron_order INTEGER DEFAULT 0
-            )
-        """)
+        conn = sqlite3.connect(str(db_path), isolation_level=None)
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+                       "cache_size=-65536", "mmap_size=268435456"):
+            conn.execute(f"PRAGMA {pragma}")
 
         # Parole italiane e inglesi per test
         mock_words = [
@@ -85,12 +130,31 @@ def create_mock_data():
             ("regola", "R EH G OW L AH", 0),
         ]
 
-        for word, phonemes, order in mock_words:
-            conn.execute("INSERT INTO word_phonemes (word, phonemes, pron_order) VALUES (?, ?, ?)",
-                        (word, phonemes, order))
-
-        conn.commit()
-        conn.close()
+        # Un'unica transazione esplicita (autocommit a livello di modulo):
+        # un solo fsync per tutto il seed, con INSERT multi-riga
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS word_phonemes (
+                    word TEXT,
+                    phonemes TEXT,
+                    pron_order INTEGER DEFAULT 0,
+                    PRIMARY KEY (word, pron_order)
+                ) WITHOUT ROWID
+            """)
+            for start in range(0, len(mock_words), INSERT_BATCH_ROWS):
+                batch = mock_words[start:start + INSERT_BATCH_ROWS]
+                placeholders = ", ".join(["(?, ?, ?)"] * len(batch))
+                conn.execute(
+                    f"INSERT INTO word_phonemes (word, phonemes, pron_order) VALUES {placeholders}",
+                    list(chain.from_iterable(batch))
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
         print(f"✅ Database mock creato con {len(mock_words)} parole")
 
     print(f"📁 Struttura mock creata in: {base_dir.absolute()}")
@@ -98,6 +162,10 @@ def create_mock_data():
 
 def main():
     """Avvia il server standalone."""
+    if "--simple" in sys.argv[1:]:
+        run_simple_server()
+        return
+
     print("🚀 Speech-to-Phrase Validator - Server Standalone")
     print("=" * 60)
 
@@ -121,7 +189,14 @@ def main():
 
     try:
         import uvicorn
+        # Import dell'app dopo aver configurato l'ambiente
+        from api.app import app
+    except ImportError as e:
+        print(f"⚠️ FastAPI non disponibile ({e}), avvio server semplice")
+        run_simple_server()
+        return
 
+    try:
         print("\n🚀 Avvio server su http://localhost:8099")
         print("📋 Test disponibili:")
         print("  - Pagina principale: http://localhost:8099")
@@ -129,9 +204,6 @@ def main():
         print("  - API docs: http://localhost:8099/docs")
         print("\n⏹️  Premi Ctrl+C per fermare")
 
-        # Import dell'app dopo aver configurato l'ambiente
-        from api.app import app
-
         uvicorn.run(
             app,
             host="0.0.0.0",
@@ -1,26 +1,45 @@
 """FastAPI application per Speech-to-Phrase Validator."""
 
 import os
+import sys
+import asyncio
+import hashlib
+import json
 import logging
+import mimetypes
 import yaml
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import Body, Depends, FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
-# Handle both standalone and addon import scenarios
+# orjson è opzionale: serializzazione JSON più veloce se disponibile
 try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+
+    _json_dumps = orjson.dumps
+except ImportError:
+    DefaultJSONResponse = JSONResponse
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+# Import come src.api.app (package completo) oppure come api.app con src/ nel path
+if __package__ and "." in __package__:
     from ..validator import SpeechToPhraseValidator
     from ..validator.predictor import get_predictor
-except ImportError:
-    # Standalone mode - adjust path
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent.parent))
+else:
+    _SRC_DIR = str(Path(__file__).parent.parent)
+    if _SRC_DIR not in sys.path:
+        sys.path.insert(0, _SRC_DIR)
     from validator import SpeechToPhraseValidator
     from validator.predictor import get_predictor
 
@@ -47,36 +66,95 @@ def get_version() -> str:
 MODELS_PATH = os.getenv("STP_MODELS_PATH", "/share/speech-to-phrase/models")
 TRAIN_PATH = os.getenv("STP_TRAIN_PATH", "/share/speech-to-phrase/train")
 TOOLS_PATH = os.getenv("STP_TOOLS_PATH", "/share/speech-to-phrase/tools")
+CACHE_PATH = os.getenv("STP_CACHE_PATH", "/data/speech_to_phrase_validator/cache")
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Speech-to-Phrase Validator",
     description="Tool di validazione e ottimizzazione per Speech-to-Phrase",
     version="0.1.0",
+    default_response_class=DefaultJSONResponse,
 )
 
+# Comprime le risposte grandi (report entità, file statici); livello 5 per contenere la CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Setup templates and static files
 BASE_DIR = Path(__file__).parent.parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "web" / "templates"))
 
 # Handle Home Assistant Ingress paths
-def get_ingress_path(request: Request) -> str:
-    """Get the ingress path prefix if available."""
-    # Check for Home Assistant ingress headers
-    ingress_path = request.headers.get("X-Ingress-Path", "")
+@lru_cache(maxsize=8)
+def _compute_ingress_path(ingress: Optional[str], forwarded: Optional[str]) -> str:
+    """Normalize the ingress prefix (constant per reverse-proxy deployment)."""
+    ingress_path = ingress or forwarded
     if not ingress_path:
-        # Fallback: check if we're behind a proxy
-        forwarded_prefix = request.headers.get("X-Forwarded-Prefix", "")
-        if forwarded_prefix:
-            ingress_path = forwarded_prefix
+        return ""
     return ingress_path.rstrip("/")
 
-# Mount static files with proper path handling
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "web" / "static")), name="static")
+
+def get_ingress_path(request: Request) -> str:
+    """Get the ingress path prefix if available."""
+    # Home Assistant ingress header, fallback to proxy prefix
+    headers = request.headers
+    return _compute_ingress_path(headers.get("X-Ingress-Path"), headers.get("X-Forwarded-Prefix"))
+
+# Static files: caricati in memoria all'avvio e serviti con ETag
+STATIC_DIR = BASE_DIR / "web" / "static"
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _load_static_files(static_dir: Path) -> Dict[str, Tuple[bytes, str, str]]:
+    """Legge i file statici in memoria: path relativo -> (contenuto, media type, ETag)."""
+    static_files = {}
+    for file_path in static_dir.rglob("*"):
+        if file_path.is_file():
+            body = file_path.read_bytes()
+            media_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            static_files[file_path.relative_to(static_dir).as_posix()] = (body, media_type, etag)
+    return static_files
+
+
+_STATIC_FILES = _load_static_files(STATIC_DIR)
+
+
+@app.get("/static/{path:path}", include_in_schema=False)
+async def static_file(path: str, request: Request):
+    """Serve un file statico dalla cache in memoria."""
+    static_entry = _STATIC_FILES.get(path)
+    if static_entry is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    body, media_type, etag = static_entry
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+# Risposte API che cambiano raramente: il browser rivalida sempre con l'ETag
+API_CACHE_CONTROL = "private, no-cache"
+
+
+def _cached_json_response(request: Request, content: Any) -> Response:
+    """Serializza content con ETag e risponde 304 se il client ha già la versione."""
+    body = _json_dumps(content)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": API_CACHE_CONTROL}
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # Initialize validator and predictor
 validator = None
 predictor = None
+_predictor_task: Optional[asyncio.Task] = None
+_validator_task: Optional[asyncio.Task] = None
+# Numero di modelli, fissato all'inizializzazione (letto da /api/health)
+_models_available = 0
 
 # Pydantic models for API
 class WordValidationRequest(BaseModel):
@@ -92,27 +170,60 @@ class SuggestionsRequest(BaseModel):
     max_suggestions: int = 5
     model_id: Optional[str] = None
 
-# New Pydantic models for Predictor
-class WordPredictionRequest(BaseModel):
-    word: str
 
-class EntityPredictionRequest(BaseModel):
-    entity_name: str
+def _warm_request_models() -> None:
+    """Valida un esempio per ogni modello di richiesta prima della prima richiesta."""
+    samples = (
+        (WordValidationRequest, b'{"word": "x", "model_id": null}'),
+        (EntityListRequest, b'{"entities": ["x"], "model_id": null}'),
+        (SuggestionsRequest, b'{"word": "x", "max_suggestions": 1, "model_id": null}'),
+    )
+    for model, sample in samples:
+        model.model_rebuild()
+        model.model_validate_json(sample).model_dump()
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Inizializza il validatore e predictor all'avvio."""
-    global validator, predictor
+    """Avvia in background validatore e predictor: il server accetta subito richieste."""
+    global _validator_task, _predictor_task
 
     _LOGGER.info("Starting Speech-to-Phrase Validator...")
     _LOGGER.info(f"Models path: {MODELS_PATH}")
     _LOGGER.info(f"Train path: {TRAIN_PATH}")
     _LOGGER.info(f"Tools path: {TOOLS_PATH}")
 
+    _warm_request_models()
+    _validator_task = asyncio.create_task(_init_validator())
+
+    # Il predictor (download modello incluso) non blocca l'avvio del server
+    _predictor_task = asyncio.create_task(_init_predictor())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Chiude le connessioni ai lessici e la sessione HTTP dei download."""
+    if validator is not None:
+        validator.close()
+    if predictor is not None:
+        await predictor.downloader.aclose()
+
+
+def _create_validator() -> SpeechToPhraseValidator:
+    """Crea il validatore e precarica il lessico (bloccante, eseguito in un thread)."""
+    new_validator = SpeechToPhraseValidator(MODELS_PATH, TRAIN_PATH, TOOLS_PATH, CACHE_PATH)
+    new_validator.preload_lexicon()
+    return new_validator
+
+
+async def _init_validator():
+    """Inizializza il validatore (eseguito in background)."""
+    global validator, _models_available
+
     try:
-        validator = SpeechToPhraseValidator(MODELS_PATH, TRAIN_PATH, TOOLS_PATH)
-        available_models = validator.get_available_models()
+        new_validator = await asyncio.to_thread(_create_validator)
+        available_models = new_validator.get_available_models()
+        _models_available = len(available_models)
         _LOGGER.info(f"Initialized validator with {len(available_models)} models")
 
         if available_models:
@@ -120,11 +231,20 @@ async def startup_event():
         else:
             _LOGGER.warning("No models found! Check Speech-to-Phrase installation.")
 
+        validator = new_validator
+        _render_home.cache_clear()
+
     except Exception as e:
         _LOGGER.error(f"Failed to initialize validator: {e}")
         validator = None
 
-    # Initialize predictor
+    return validator
+
+
+async def _init_predictor():
+    """Inizializza il predictor (eseguito in background)."""
+    global predictor
+
     try:
         _LOGGER.info("Initializing Speech-to-Phrase Predictor...")
         predictor = await get_predictor()
@@ -136,77 +256,131 @@ async def startup_event():
         _LOGGER.error(f"Failed to initialize predictor: {e}")
         predictor = None
 
+    return predictor
+
+
+async def _get_ready_predictor():
+    """Ottiene il predictor, attendendo l'inizializzazione se ancora in corso."""
+    if predictor is None and _predictor_task is not None:
+        # shield: una richiesta annullata non deve annullare l'inizializzazione
+        await asyncio.shield(_predictor_task)
+    return predictor
+
+
+async def require_validator() -> SpeechToPhraseValidator:
+    """Dependency: restituisce il validatore o risponde 503."""
+    if validator is None:
+        detail = "Validator initializing" if _validator_initializing() else "Validator not initialized"
+        raise HTTPException(status_code=503, detail=detail)
+    return validator
+
+
+async def require_predictor():
+    """Dependency: restituisce il predictor (attendendo l'inizializzazione) o risponde 503."""
+    current_predictor = await _get_ready_predictor()
+    if not current_predictor:
+        raise HTTPException(status_code=503, detail="Predictor not initialized")
+    return current_predictor
+
+
+async def require_ready_predictor():
+    """Dependency: come require_predictor, ma richiede un predictor inizializzato."""
+    current_predictor = await require_predictor()
+    if not current_predictor.is_initialized():
+        raise HTTPException(status_code=503, detail="Predictor not ready")
+    return current_predictor
+
+
+def _ensure_model(current_validator: SpeechToPhraseValidator, model_id: Optional[str]) -> None:
+    """Verifica il modello richiesto (senza cambiare il modello corrente)."""
+    if model_id and not current_validator.has_model(model_id):
+        raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+
+
+_MODEL_TEMPLATE_FIELDS = ("id", "type", "language", "description", "is_current")
+
+
+@lru_cache(maxsize=32)
+def _render_home(ingress_path: str, models: tuple, has_validator: bool) -> str:
+    """Renderizza index.html (cache per stato del validatore e ingress path)."""
+    model_dicts = [dict(zip(_MODEL_TEMPLATE_FIELDS, model)) for model in models]
+    current_model = next((m for m in model_dicts if m["is_current"]), None)
+
+    return templates.get_template("index.html").render(
+        models=model_dicts,
+        current_model=current_model,
+        has_validator=has_validator,
+        ingress_path=ingress_path,
+        version=get_version(),
+    )
+
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Pagina principale dell'interfaccia web."""
-    models = []
-    current_model = None
+    models = ()
 
     if validator:
-        models = validator.get_available_models()
-        current_model = next((m for m in models if m["is_current"]), None)
+        models = tuple(
+            tuple(m[field] for field in _MODEL_TEMPLATE_FIELDS)
+            for m in validator.get_available_models()
+        )
 
     ingress_path = get_ingress_path(request)
 
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "models": models,
-        "current_model": current_model,
-        "has_validator": validator is not None,
-        "ingress_path": ingress_path,
-        "version": get_version()
-    })
+    return HTMLResponse(_render_home(ingress_path, models, validator is not None))
+
+
+def _validator_initializing() -> bool:
+    """Indica se l'inizializzazione del validatore è ancora in corso."""
+    return _validator_task is not None and not _validator_task.done()
 
 
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
+    if _validator_initializing():
+        return {
+            "status": "initializing",
+            "message": "Validator initializing",
+            "models_available": 0
+        }
+
     return {
         "status": "ok" if validator else "error",
         "message": "Validator initialized" if validator else "Validator not initialized",
-        "models_available": len(validator.get_available_models()) if validator else 0
+        "models_available": _models_available if validator else 0
     }
 
 
 @app.get("/api/models")
-async def get_models():
+def get_models(request: Request, current_validator: SpeechToPhraseValidator = Depends(require_validator)):
     """Ottiene la lista dei modelli disponibili."""
-    if not validator:
-        raise HTTPException(status_code=503, detail="Validator not initialized")
-
-    return validator.get_available_models()
+    return _cached_json_response(request, current_validator.get_available_models())
 
 
 @app.post("/api/models/{model_id}/select")
-async def select_model(model_id: str):
+def select_model(model_id: str, current_validator: SpeechToPhraseValidator = Depends(require_validator)):
     """Seleziona un modello per la validazione."""
-    if not validator:
-        raise HTTPException(status_code=503, detail="Validator not initialized")
-
-    success = validator.set_model(model_id)
+    success = current_validator.set_model(model_id)
     if not success:
         raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
 
+    _render_home.cache_clear()
+
     return {"status": "success", "model_id": model_id}
 
 
 @app.post("/api/validate/word")
-async def validate_word(request: WordValidationRequest):
+def validate_word(request: WordValidationRequest,
+                  current_validator: SpeechToPhraseValidator = Depends(require_validator)):
     """Valida una singola parola."""
-    if not validator:
-        raise HTTPException(status_code=503, detail="Validator not initialized")
-
-    # Cambia modello se specificato
-    if request.model_id:
-        success = validator.set_model(request.model_id)
-        if not success:
-            raise HTTPException(status_code=404, detail=f"Model {request.model_id} not found")
+    _ensure_model(current_validator, request.model_id)
 
-    result = validator.validate_word(request.word)
+    result = current_validator.validate_word(request.word, model_id=request.model_id)
 
-    # Converte il risultato in un dict JSON-serializable
-    return {
+    # Risposta già costruita: FastAPI non ripassa il dict in jsonable_encoder
+    return DefaultJSONResponse({
         "word": result.word,
         "status": result.status.value,
         "is_known": result.is_known,
@@ -216,24 +390,18 @@ async def validate_word(request: WordValidationRequest):
         "model_id": result.model_id,
         "confidence": result.confidence,
         "notes": result.notes
-    }
+    })
 
 
 @app.post("/api/validate/entity")
-async def validate_entity(entity_name: str, model_id: Optional[str] = None):
+def validate_entity(entity_name: str, model_id: Optional[str] = None,
+                    current_validator: SpeechToPhraseValidator = Depends(require_validator)):
     """Valida il nome di un'entità."""
-    if not validator:
-        raise HTTPException(status_code=503, detail="Validator not initialized")
+    _ensure_model(current_validator, model_id)
 
-    # Cambia modello se specificato
-    if model_id:
-        success = validator.set_model(model_id)
-        if not success:
-            raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+    result = current_validator.validate_entity_name(entity_name, model_id=model_id)
 
-    result = validator.validate_entity_name(entity_name)
-
-    return {
+    return DefaultJSONResponse({
         "entity_id": result.entity_id,
         "friendly_name": result.friendly_name,
         "words_results": [
@@ -251,23 +419,11 @@ async def validate_entity(entity_name: str, model_id: Optional[str] = None):
         ],
         "overall_status": result.overall_status.value,
         "recommendations": result.recommendations
-    }
-
-
-@app.post("/api/validate/entities")
-async def validate_entities(request: EntityListRequest):
-    """Valida una lista di entità."""
-    if not validator:
-        raise HTTPException(status_code=503, detail="Validator not initialized")
-
-    # Cambia modello se specificato
-    if request.model_id:
-        success = validator.set_model(request.model_id)
-        if not success:
-            raise HTTPException(status_code=404, detail=f"Model {request.model_id} not found")
+    })
 
-    report = validator.validate_entities_list(request.entities)
 
+def _report_summary(report) -> Dict[str, Any]:
+    """Campi di riepilogo di un ValidationReport (senza i risultati per entità)."""
     return {
         "model_id": report.model_id,
         "total_entities": report.total_entities,
@@ -276,64 +432,95 @@ async def validate_entities(request: EntityListRequest):
         "partially_known_entities": report.partially_known_entities,
         "overall_score": report.overall_score,
         "recommendations": report.recommendations,
-        "entity_results": [
-            {
-                "entity_id": er.entity_id,
-                "friendly_name": er.friendly_name,
-                "overall_status": er.overall_status.value,
-                "recommendations": er.recommendations,
-                "words_count": len(er.words_results),
-                "known_words": sum(1 for wr in er.words_results if wr.is_known),
-            }
-            for er in report.entity_results
-        ]
     }
 
 
+@app.post("/api/validate/entities")
+def validate_entities(request: EntityListRequest,
+                      current_validator: SpeechToPhraseValidator = Depends(require_validator)):
+    """Valida una lista di entità."""
+    _ensure_model(current_validator, request.model_id)
+
+    model_id = request.model_id or current_validator.current_model_id
+    if model_id is None:
+        # Nessun modello: il report è vuoto, inutile lo streaming
+        report = current_validator.validate_entities_list(request.entities)
+        return DefaultJSONResponse({**_report_summary(report), "entity_results": []})
+
+    # Il primo blocco viene validato prima di rispondere: gli errori iniziali
+    # restano errori HTTP invece di un documento troncato con status 200
+    entity_results = current_validator.iter_entity_results(request.entities, model_id=model_id)
+    first_result = next(entity_results, None)
+
+    def iter_report():
+        """Valida e serializza un'entità alla volta; il riepilogo chiude il documento."""
+        status_counts = Counter()
+        yield b'{"entity_results": ['
+
+        try:
+            if first_result is not None:
+                for index, er in enumerate(chain((first_result,), entity_results)):
+                    status_counts[er.overall_status] += 1
+                    entity_json = _json_dumps({
+                        "entity_id": er.entity_id,
+                        "friendly_name": er.friendly_name,
+                        "overall_status": er.overall_status.value,
+                        "recommendations": er.recommendations,
+                        "words_count": len(er.words_results),
+                        "known_words": er.known_words_count,
+                    })
+                    yield entity_json if index == 0 else b"," + entity_json
+
+            report = current_validator.summarize_entities(model_id, status_counts)
+        except Exception as e:
+            # Lo status 200 è già stato inviato: chiude il documento con lo stesso
+            # schema, riepilogando le entità validate finora e segnalando l'errore
+            _LOGGER.error(f"Error validating entities: {e}")
+            report = SpeechToPhraseValidator.summarize_entities(model_id, status_counts)
+            yield b"], " + _json_dumps({
+                **_report_summary(report),
+                "overall_status": "error",
+                "error": str(e),
+            })[1:]
+            return
+
+        yield b"], " + _json_dumps(_report_summary(report))[1:]
+
+    return StreamingResponse(iter_report(), media_type="application/json")
+
+
 @app.post("/api/suggest")
-async def suggest_alternatives(request: SuggestionsRequest):
+def suggest_alternatives(request: SuggestionsRequest,
+                         current_validator: SpeechToPhraseValidator = Depends(require_validator)):
     """Suggerisce alternative per una parola."""
-    if not validator:
-        raise HTTPException(status_code=503, detail="Validator not initialized")
-
-    # Cambia modello se specificato
-    if request.model_id:
-        success = validator.set_model(request.model_id)
-        if not success:
-            raise HTTPException(status_code=404, detail=f"Model {request.model_id} not found")
+    _ensure_model(current_validator, request.model_id)
 
-    suggestions = validator.suggest_alternatives(request.word, request.max_suggestions)
+    suggestions = current_validator.suggest_alternatives(
+        request.word, request.max_suggestions, model_id=request.model_id
+    )
     return {"word": request.word, "suggestions": suggestions}
 
 
 @app.get("/api/stats")
-async def get_statistics():
+def get_statistics(request: Request, current_validator: SpeechToPhraseValidator = Depends(require_validator)):
     """Ottiene statistiche sul modello corrente."""
-    if not validator:
-        raise HTTPException(status_code=503, detail="Validator not initialized")
-
-    stats = validator.get_model_statistics()
+    stats = current_validator.get_model_statistics()
     if not stats:
         raise HTTPException(status_code=400, detail="No model selected")
 
-    return stats
+    return _cached_json_response(request, stats)
 
 
 # NEW: Predictor API Endpoints
 
 @app.post("/api/predict/word")
-async def predict_word_recognition(request: WordPredictionRequest):
+async def predict_word_recognition(word: str = Body(..., embed=True),
+                                  current_predictor=Depends(require_ready_predictor)):
     """Predici la riconoscibilità di una parola prima di aggiungerla ad Assist."""
-    if not predictor:
-        raise HTTPException(status_code=503, detail="Predictor not initialized")
-
-    if not predictor.is_initialized():
-        raise HTTPException(status_code=503, detail="Predictor not ready")
-
     try:
-        prediction = predictor.predict_word(request.word)
+        prediction = current_predictor.predict_word(word)
 
-        return {
+        return DefaultJSONResponse({
             "word": prediction.word,
             "confidence": prediction.confidence.value,
             "confidence_score": prediction.confidence_score,
@@ -345,25 +532,20 @@ async def predict_word_recognition(request: WordPredictionRequest):
             "similar_words": [{"word": w[0], "similarity": w[1]} for w in prediction.similar_words],
             "recommendation": prediction.recommendation,
             "notes": prediction.notes
-        }
+        })
     except Exception as e:
-        _LOGGER.error(f"Error predicting word '{request.word}': {e}")
+        _LOGGER.error(f"Error predicting word '{word}': {e}")
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
 
 @app.post("/api/predict/entity")
-async def predict_entity_recognition(request: EntityPredictionRequest):
+async def predict_entity_recognition(entity_name: str = Body(..., embed=True),
+                                    current_predictor=Depends(require_ready_predictor)):
     """Predici la riconoscibilità di un'entità completa prima di aggiungerla ad Assist."""
-    if not predictor:
-        raise HTTPException(status_code=503, detail="Predictor not initialized")
-
-    if not predictor.is_initialized():
-        raise HTTPException(status_code=503, detail="Predictor not ready")
-
     try:
-        prediction = predictor.predict_entity(request.entity_name)
+        prediction = current_predictor.predict_entity(entity_name)
 
-        return {
+        return DefaultJSONResponse({
             "entity_name": prediction.entity_name,
             "overall_confidence": prediction.overall_confidence.value,
             "overall_score": prediction.overall_score,
@@ -386,20 +568,17 @@ async def predict_entity_recognition(request: EntityPredictionRequest):
             ],
             "recommendations": prediction.recommendations,
             "suggested_alternatives": prediction.suggested_alternatives
-        }
+        })
     except Exception as e:
-        _LOGGER.error(f"Error predicting entity '{request.entity_name}': {e}")
+        _LOGGER.error(f"Error predicting entity '{entity_name}': {e}")
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
 
 @app.get("/api/predict/stats")
-async def get_predictor_statistics():
+async def get_predictor_statistics(current_predictor=Depends(require_predictor)):
     """Ottiene statistiche sul predictor e modelli disponibili."""
-    if not predictor:
-        raise HTTPException(status_code=503, detail="Predictor not initialized")
-
     try:
-        stats = await predictor.get_predictor_statistics()
+        stats = await current_predictor.get_predictor_statistics()
         return stats
     except Exception as e:
         _LOGGER.error(f"Error getting predictor statistics: {e}")
@@ -412,7 +591,7 @@ async def predictor_health_check():
     return {
         "predictor_available": predictor is not None,
         "predictor_initialized": predictor.is_initialized() if predictor else False,
-        "current_model": predictor._current_model if predictor and predictor.is_initialized() else None,
+        "current_model": predictor.current_model_id if predictor else None,
         "status": "ready" if (predictor and predictor.is_initialized()) else "not_ready"
     }
 
@@ -429,6 +608,7 @@ if __name__ == "__main__":
         "src.api.app:app",
         host=host,
         port=port,
+        workers=int(os.getenv("STP_WORKERS", "1")),
         log_level=os.getenv("STP_LOG_LEVEL", "info").lower(),
         reload=False
     )
\ No newline at end of file
@@ -1,15 +1,37 @@
 """Core validation functionality per Speech-to-Phrase."""
 
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
+from pathlib import Path
 
 from .model_manager import ModelManager, ModelInfo
 from .lexicon_wrapper import LexiconWrapper
+from .lru_cache import LRUCache
 
 _LOGGER = logging.getLogger(__name__)
 
+# Separatori nei nomi delle entità, convertiti in spazi in un solo passaggio
+_ENTITY_SEPARATORS = str.maketrans({"_": " ", "-": " "})
+
+# Entità validate per blocco: limita la memoria delle liste molto lunghe
+ENTITY_BATCH_SIZE = 500
+
+# Combinazioni di parole (per modello) con risultato di entità memorizzato
+ENTITY_CACHE_SIZE = 5000
+
+# Thread del validatore per Phonetisaurus (in parallelo alla ricerca delle parole simili)
+GUESS_WORKERS = 2
+
+# Note costanti dei risultati, condivise invece di essere ricostruite per parola
+_NOTE_KNOWN_SINGLE = "Parola riconosciuta con 1 pronuncia/e"
+_NOTE_GUESSED = "Pronuncia indovinata usando modello G2P"
+_NOTE_UNKNOWN = "Parola non riconosciuta e pronuncia non indovinabile"
+
 
 class ValidationStatus(str, Enum):
     """Status di validazione per una parola."""
@@ -19,13 +41,13 @@ class ValidationStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class WordValidationResult:
     """Risultato della validazione di una parola."""
     word: str
     status: ValidationStatus
     is_known: bool
-    pronunciations: List[List[str]]
+    pronunciations: List[Tuple[str, ...]]
     guessed_pronunciation: Optional[List[str]]
     similar_words: List[tuple]
     model_id: str
@@ -37,7 +59,7 @@ class WordValidationResult:
             self.notes = []
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityValidationResult:
     """Risultato della validazione di un'entità."""
     entity_id: str
@@ -45,9 +67,10 @@ class EntityValidationResult:
     words_results: List[WordValidationResult]
     overall_status: ValidationStatus
     recommendations: List[str]
+    known_words_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Report completo di validazione."""
     model_id: str
@@ -63,36 +86,107 @@ class ValidationReport:
 class SpeechToPhraseValidator:
     """Validatore principale per Speech-to-Phrase."""
 
-    def __init__(self, models_path: str, train_path: str, tools_path: str):
+    def __init__(self, models_path: str, train_path: str, tools_path: str,
+                 cache_path: Optional[str] = None):
         """Inizializza il validatore."""
         self.model_manager = ModelManager(models_path, train_path, tools_path)
+        # Directory per la cache dei lessici testuali analizzati (None = disattivata)
+        self._cache_path = Path(cache_path) if cache_path else None
         self._current_model: Optional[ModelInfo] = None
         self._current_lexicon: Optional[LexiconWrapper] = None
+        # Lessici già caricati per modello, riusati tra le richieste. Si creano solo
+        # per i modelli del ModelManager: il dizionario è limitato ai modelli installati
+        self._lexicons: Dict[str, LexiconWrapper] = {}
+        self._lexicons_lock = threading.Lock()
+        # Lista modelli serializzata, invalidata al cambio di modello
+        self._available_models: Optional[List[Dict[str, Any]]] = None
+        # Risultati per (modello, parole normalizzate): entità con le stesse
+        # parole condividono lo stesso risultato
+        self._entity_result_cache: LRUCache = LRUCache(ENTITY_CACHE_SIZE)
+        # Executor condiviso tra le richieste: i thread vengono creati una volta sola
+        self._guess_executor = ThreadPoolExecutor(max_workers=GUESS_WORKERS, thread_name_prefix="g2p")
 
         # Carica il modello di default
         default_model = self.model_manager.get_default_model()
         if default_model:
             self.set_model(default_model.id)
 
-    def set_model(self, model_id: str) -> bool:
-        """Imposta il modello corrente per la validazione."""
+    @property
+    def current_model_id(self) -> Optional[str]:
+        """ID del modello corrente (None se nessun modello è selezionato)."""
+        return self._current_model.id if self._current_model else None
+
+    def __enter__(self) -> "SpeechToPhraseValidator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Chiude le connessioni ai database dei lessici caricati e l'executor G2P."""
+        for lexicon in self._lexicons.values():
+            lexicon.close()
+        self._guess_executor.shutdown(wait=False)
+
+    def has_model(self, model_id: str) -> bool:
+        """Verifica se un modello è disponibile."""
+        return self.model_manager.get_model(model_id) is not None
+
+    def _get_lexicon(self, model_id: Optional[str] = None) -> Optional[LexiconWrapper]:
+        """Ottiene il lessico di un modello (default: modello corrente)."""
+        if model_id is None:
+            return self._current_lexicon
+
+        lexicon = self._lexicons.get(model_id)
+        if lexicon is not None:
+            return lexicon
+
         model = self.model_manager.get_model(model_id)
         if not model:
+            return None
+
+        # Richieste concorrenti per lo stesso modello condividono un solo lessico
+        with self._lexicons_lock:
+            lexicon = self._lexicons.get(model_id)
+            if lexicon is None:
+                phonetisaurus_binary = self.model_manager.get_phonetisaurus_binary()
+                lexicon = LexiconWrapper(model, phonetisaurus_binary, self._cache_path)
+                self._lexicons[model_id] = lexicon
+
+        return lexicon
+
+    def set_model(self, model_id: str) -> bool:
+        """Imposta il modello di default per la validazione."""
+        if model_id == self.current_model_id:
+            return True
+
+        lexicon = self._get_lexicon(model_id)
+        if not lexicon:
             _LOGGER.error(f"Model not found: {model_id}")
             return False
 
-        self._current_model = model
-
-        # Inizializza il wrapper del lessico
-        phonetisaurus_binary = self.model_manager.get_phonetisaurus_binary()
-        self._current_lexicon = LexiconWrapper(model, phonetisaurus_binary)
+        self._current_model = lexicon.model_info
+        self._current_lexicon = lexicon
+        self._available_models = None
 
         _LOGGER.info(f"Set current model to: {model_id}")
         return True
 
+    def preload_lexicon(self) -> None:
+        """Precarica in memoria il lessico del modello corrente."""
+        if self._current_lexicon:
+            self._current_lexicon.preload()
+
     def get_available_models(self) -> List[Dict[str, Any]]:
         """Ottiene la lista dei modelli disponibili."""
+        if self._available_models is None:
+            self._available_models = self._build_available_models()
+        return self._available_models
+
+    def _build_available_models(self) -> List[Dict[str, Any]]:
+        """Costruisce la lista dei modelli disponibili."""
         models = self.model_manager.get_available_models()
+        current_model_id = self.current_model_id
         return [
             {
                 "id": model.id,
@@ -100,107 +194,150 @@ class SpeechToPhraseValidator:
                 "language": model.language,
                 "language_family": model.language_family,
                 "description": model.description,
-                "is_current": self._current_model and model.id == self._current_model.id,
+                "is_current": model.id == current_model_id,
             }
             for model in models
         ]
 
-    def validate_word(self, word: str) -> WordValidationResult:
+    def validate_word(self, word: str, model_id: Optional[str] = None) -> WordValidationResult:
         """Valida una singola parola."""
-        if not self._current_lexicon:
-            return WordValidationResult(
-                word=word,
-                status=ValidationStatus.ERROR,
-                is_known=False,
-                pronunciations=[],
-                guessed_pronunciation=None,
-                similar_words=[],
-                model_id="none",
-                notes=["No model selected"]
-            )
+        return self.validate_words_batch([word], model_id)[word]
 
-        try:
-            # Ottieni lo status della parola
-            word_status = self._current_lexicon.get_word_status(word)
-
-            # Trova parole simili se la parola non è conosciuta
-            similar_words = []
-            if not word_status["is_known"]:
-                similar_words = self._current_lexicon.find_similar_words(word)
-
-            # Determina lo status di validazione
-            if word_status["is_known"]:
-                status = ValidationStatus.KNOWN
-                confidence = 1.0
-            elif word_status["guessed_pronunciation"]:
-                status = ValidationStatus.GUESSED
-                confidence = 0.7  # Fiducia media per pronunce indovinate
-            else:
-                status = ValidationStatus.UNKNOWN
-                confidence = 0.0
-
-            # Genera note
-            notes = []
-            if status == ValidationStatus.KNOWN:
-                notes.append(f"Parola riconosciuta con {len(word_status['pronunciations'])} pronuncia/e")
-            elif status == ValidationStatus.GUESSED:
-                notes.append("Pronuncia indovinata usando modello G2P")
-            else:
-                notes.append("Parola non riconosciuta e pronuncia non indovinabile")
-
-            if similar_words:
-                notes.append(f"Trovate {len(similar_words)} parole simili")
-
-            return WordValidationResult(
-                word=word,
-                status=status,
-                is_known=word_status["is_known"],
-                pronunciations=word_status["pronunciations"],
-                guessed_pronunciation=word_status["guessed_pronunciation"],
-                similar_words=similar_words,
-                model_id=word_status["model_id"],
-                confidence=confidence,
-                notes=notes
-            )
+    def validate_words_batch(self, words: List[str], model_id: Optional[str] = None) -> Dict[str, WordValidationResult]:
+        """Valida più parole in un'unica passata (ogni parola distinta una sola volta)."""
+        unique_words = list(dict.fromkeys(words))
+        lexicon = self._get_lexicon(model_id)
+        if not lexicon:
+            note = f"Model not found: {model_id}" if model_id else "No model selected"
+            return {word: self._error_result(word, model_id or "none", note) for word in unique_words}
 
+        try:
+            words_status = lexicon.get_words_status(unique_words, guess=False)
+            unknown_words = [word for word in unique_words if not words_status[word]["is_known"]]
+            similar_by_word = self._resolve_unknown_words(lexicon, unknown_words, words_status)
         except Exception as e:
-            _LOGGER.error(f"Error validating word '{word}': {e}")
-            return WordValidationResult(
-                word=word,
-                status=ValidationStatus.ERROR,
-                is_known=False,
-                pronunciations=[],
-                guessed_pronunciation=None,
-                similar_words=[],
-                model_id=self._current_model.id if self._current_model else "unknown",
-                notes=[f"Validation error: {str(e)}"]
-            )
+            _LOGGER.error(f"Error validating {len(unique_words)} words: {e}")
+            note = f"Validation error: {str(e)}"
+            return {word: self._error_result(word, lexicon.model_info.id, note) for word in unique_words}
+
+        results = {}
+        for word in unique_words:
+            try:
+                results[word] = self._build_word_result(words_status[word], similar_by_word.get(word, []))
+            except Exception as e:
+                _LOGGER.error(f"Error validating word '{word}': {e}")
+                results[word] = self._error_result(word, lexicon.model_info.id, f"Validation error: {str(e)}")
+
+        return results
+
+    @staticmethod
+    def _error_result(word: str, model_id: str, note: str) -> WordValidationResult:
+        """Crea un risultato di errore per una parola."""
+        return WordValidationResult(
+            word=word,
+            status=ValidationStatus.ERROR,
+            is_known=False,
+            pronunciations=[],
+            guessed_pronunciation=None,
+            similar_words=[],
+            model_id=model_id,
+            notes=[note]
+        )
 
-    def validate_entity_name(self, entity_name: str) -> EntityValidationResult:
-        """Valida il nome di un'entità (che può contenere più parole)."""
-        # Divide il nome dell'entità in parole
-        words = entity_name.lower().replace("_", " ").replace("-", " ").split()
+    def _resolve_unknown_words(self, lexicon: LexiconWrapper, unknown_words: List[str],
+                               words_status: Dict[str, Dict[str, Any]]) -> Dict[str, List[tuple]]:
+        """Indovina le pronunce e cerca le parole simili delle parole sconosciute."""
+        if not unknown_words:
+            return {}
+
+        if lexicon.can_guess_pronunciations:
+            # Phonetisaurus gira in un thread mentre qui si cercano le parole simili
+            guesses_future = self._guess_executor.submit(lexicon.guess_pronunciations, unknown_words)
+            similar_by_word = {word: lexicon.find_similar_words(word) for word in unknown_words}
+            guesses = guesses_future.result()
+        else:
+            similar_by_word = {word: lexicon.find_similar_words(word) for word in unknown_words}
+            guesses = {}
+
+        for word in unknown_words:
+            words_status[word]["guessed_pronunciation"] = guesses.get(word)
+
+        return similar_by_word
+
+    @staticmethod
+    def _build_word_result(word_status: Dict[str, Any], similar_words: List[tuple]) -> WordValidationResult:
+        """Costruisce il risultato di validazione dallo status di una parola."""
+        word = word_status["word"]
+
+        # Determina lo status di validazione
+        if word_status["is_known"]:
+            status = ValidationStatus.KNOWN
+            confidence = 1.0
+        elif word_status["guessed_pronunciation"]:
+            status = ValidationStatus.GUESSED
+            confidence = 0.7  # Fiducia media per pronunce indovinate
+        else:
+            status = ValidationStatus.UNKNOWN
+            confidence = 0.0
+
+        # Genera note
+        if status == ValidationStatus.KNOWN:
+            num_prons = len(word_status["pronunciations"])
+            notes = [_NOTE_KNOWN_SINGLE if num_prons == 1
+                     else f"Parola riconosciuta con {num_prons} pronuncia/e"]
+        elif status == ValidationStatus.GUESSED:
+            notes = [_NOTE_GUESSED]
+        else:
+            notes = [_NOTE_UNKNOWN]
+
+        if similar_words:
+            notes.append(f"Trovate {len(similar_words)} parole simili")
+
+        return WordValidationResult(
+            word=word,
+            status=status,
+            is_known=word_status["is_known"],
+            pronunciations=word_status["pronunciations"],
+            guessed_pronunciation=word_status["guessed_pronunciation"],
+            similar_words=similar_words,
+            model_id=word_status["model_id"],
+            confidence=confidence,
+            notes=notes
+        )
+
+    @staticmethod
+    def _split_entity_name(entity_name: str) -> List[str]:
+        """Divide il nome di un'entità in parole."""
+        return entity_name.lower().translate(_ENTITY_SEPARATORS).split()
 
-        word_results = []
-        for word in words:
-            if word:  # Salta parole vuote
-                result = self.validate_word(word)
-                word_results.append(result)
+    def validate_entity_name(self, entity_name: str, model_id: Optional[str] = None) -> EntityValidationResult:
+        """Valida il nome di un'entità (che può contenere più parole)."""
+        return next(self.iter_entity_results([entity_name], model_id))
+
+    @staticmethod
+    def _build_entity_result(entity_name: str, word_results: List[WordValidationResult]) -> EntityValidationResult:
+        """Aggrega i risultati delle parole di un'entità."""
+        # Un solo passaggio sulle parole: conteggio note e raccolta sconosciute
+        known_words_count = 0
+        unknown_words = []
+        for r in word_results:
+            if r.status == ValidationStatus.KNOWN:
+                known_words_count += 1
+            elif r.status == ValidationStatus.UNKNOWN:
+                unknown_words.append(r)
 
         # Determina lo status complessivo
         if not word_results:
             overall_status = ValidationStatus.ERROR
-        elif all(r.status == ValidationStatus.KNOWN for r in word_results):
+        elif known_words_count == len(word_results):
             overall_status = ValidationStatus.KNOWN
-        elif any(r.status == ValidationStatus.UNKNOWN for r in word_results):
+        elif unknown_words:
             overall_status = ValidationStatus.UNKNOWN
         else:
             overall_status = ValidationStatus.GUESSED
 
         # Genera raccomandazioni
         recommendations = []
-        unknown_words = [r for r in word_results if r.status == ValidationStatus.UNKNOWN]
-
         if unknown_words:
             recommendations.append(f"Considera di sostituire: {', '.join(r.word for r in unknown_words)}")
 
@@ -218,14 +355,16 @@ class SpeechToPhraseValidator:
             friendly_name=entity_name,
             words_results=word_results,
             overall_status=overall_status,
-            recommendations=recommendations
+            recommendations=recommendations,
+            known_words_count=known_words_count
         )
 
-    def validate_entities_list(self, entities: List[str]) -> ValidationReport:
+    def validate_entities_list(self, entities: List[str], model_id: Optional[str] = None) -> ValidationReport:
         """Valida una lista di entità."""
-        if not self._current_model:
+        lexicon = self._get_lexicon(model_id)
+        if not lexicon:
             return ValidationReport(
-                model_id="none",
+                model_id=model_id or "none",
                 total_entities=0,
                 known_entities=0,
                 unknown_entities=0,
@@ -235,23 +374,55 @@ class SpeechToPhraseValidator:
                 recommendations=["No model selected"]
             )
 
-        entity_results = []
-        known_count = 0
-        unknown_count = 0
-        partially_known_count = 0
-
-        for entity in entities:
-            result = self.validate_entity_name(entity)
-            entity_results.append(result)
-
-            if result.overall_status == ValidationStatus.KNOWN:
-                known_count += 1
-            elif result.overall_status == ValidationStatus.UNKNOWN:
-                unknown_count += 1
-            else:
-                partially_known_count += 1
+        entity_results = list(self.iter_entity_results(entities, model_id))
+        status_counts = Counter(result.overall_status for result in entity_results)
+        return self.summarize_entities(lexicon.model_info.id, status_counts, entity_results)
+
+    def iter_entity_results(self, entities: List[str],
+                            model_id: Optional[str] = None) -> Iterator[EntityValidationResult]:
+        """Valida le entità a blocchi, restituendo un risultato alla volta."""
+        cache_model_id = model_id or self.current_model_id
+        # Risultati delle parole già validate nei blocchi precedenti: ogni parola
+        # distinta della lista viene validata una sola volta
+        results_by_word: Dict[str, WordValidationResult] = {}
+        for start in range(0, len(entities), ENTITY_BATCH_SIZE):
+            batch = entities[start:start + ENTITY_BATCH_SIZE]
+
+            # Divide le entità del blocco e cerca le combinazioni di parole già validate
+            entity_words = [tuple(self._split_entity_name(entity)) for entity in batch]
+            cached: Dict[Tuple[str, ...], Optional[EntityValidationResult]] = {
+                words: self._entity_result_cache.get((cache_model_id, words))
+                for words in entity_words
+            }
 
-        total_entities = len(entities)
+            # Valida in un solo batch le parole nuove delle combinazioni mancanti
+            missing_words = [
+                word for words, result in cached.items() if result is None
+                for word in words if word not in results_by_word
+            ]
+            if missing_words:
+                results_by_word.update(self.validate_words_batch(missing_words, model_id))
+
+            for entity, words in zip(batch, entity_words):
+                result = cached[words]
+                if result is None:
+                    result = self._build_entity_result(entity, [results_by_word[word] for word in words])
+                    cached[words] = result
+                    # Gli errori (es. modello non disponibile) non vanno memorizzati
+                    if all(r.status != ValidationStatus.ERROR for r in result.words_results):
+                        self._entity_result_cache[(cache_model_id, words)] = result
+                    yield result
+                else:
+                    yield replace(result, entity_id=entity, friendly_name=entity)
+
+    @staticmethod
+    def summarize_entities(model_id: str, status_counts: Counter,
+                           entity_results: Optional[List[EntityValidationResult]] = None) -> ValidationReport:
+        """Costruisce il report dai conteggi degli status delle entità."""
+        known_count = status_counts[ValidationStatus.KNOWN]
+        unknown_count = status_counts[ValidationStatus.UNKNOWN]
+        total_entities = sum(status_counts.values())
+        partially_known_count = total_entities - known_count - unknown_count
         overall_score = known_count / total_entities if total_entities > 0 else 0.0
 
         # Genera raccomandazioni generali
@@ -266,12 +437,12 @@ class SpeechToPhraseValidator:
             recommendations.append("Considera di rinominare entità con parole più comuni")
 
         return ValidationReport(
-            model_id=self._current_model.id,
+            model_id=model_id,
             total_entities=total_entities,
             known_entities=known_count,
             unknown_entities=unknown_count,
             partially_known_entities=partially_known_count,
-            entity_results=entity_results,
+            entity_results=entity_results if entity_results is not None else [],
             overall_score=overall_score,
             recommendations=recommendations
         )
@@ -283,16 +454,20 @@ class SpeechToPhraseValidator:
 
         return self._current_lexicon.get_statistics()
 
-    def suggest_alternatives(self, word: str, max_suggestions: int = 5) -> List[Dict[str, Any]]:
+    def suggest_alternatives(self, word: str, max_suggestions: int = 5,
+                             model_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Suggerisce alternative per una parola."""
-        if not self._current_lexicon:
+        lexicon = self._get_lexicon(model_id)
+        if not lexicon:
             return []
 
-        similar_words = self._current_lexicon.find_similar_words(word, max_suggestions)
+        similar_words = lexicon.find_similar_words(word, max_suggestions)
+
+        words_status = lexicon.get_words_status([similar_word for similar_word, _ in similar_words])
 
         suggestions = []
         for similar_word, score in similar_words:
-            word_status = self._current_lexicon.get_word_status(similar_word)
+            word_status = words_status[similar_word]
             suggestions.append({
                 "word": similar_word,
                 "similarity_score": score,
@@ -1,46 +1,94 @@
 """Wrapper per LexiconDatabase di Speech-to-Phrase."""
 
+import gc
+import heapq
+import os
+import pickle
 import sqlite3
 import subprocess
 import tempfile
+import threading
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
 import sys
-import os
+import weakref
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, KeysView, List, Optional, Tuple, Union
 
-# Aggiungi il percorso di speech-to-phrase al PYTHONPATH per importare i moduli
-_SPEECH_TO_PHRASE_PATH = Path(__file__).parent.parent.parent.parent / "speech-to-phrase"
-if _SPEECH_TO_PHRASE_PATH.exists():
-    sys.path.insert(0, str(_SPEECH_TO_PHRASE_PATH))
+from .lru_cache import LRUCache
+from .similarity import HAS_RAPIDFUZZ, BKTree, extract_most_similar
+from .sqlite_utils import connect_lexicon_db
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Pronuncia come tupla di fonemi: più compatta di una lista e immutabile
+Pronunciation = Tuple[str, ...]
+
+
+def _split_phonemes(phonemes: str) -> Pronunciation:
+    """Divide una pronuncia in fonemi internati.
+
+    I simboli distinti sono poche decine: con sys.intern tutte le pronunce
+    condividono gli stessi oggetti stringa invece di allocarne uno per fonema.
+    """
+    return tuple(map(sys.intern, phonemes.split()))
+
+
 class LexiconWrapper:
     """Wrapper per gestire il lessico di Speech-to-Phrase."""
 
-    def __init__(self, model_info, phonetisaurus_binary: Optional[Path] = None):
+    # Numero massimo di parole per query IN (...)
+    LOOKUP_BATCH_SIZE = 500
+
+    # Voci massime nella cache dei lookup
+    LOOKUP_CACHE_SIZE = 10000
+
+    # Versione del formato della cache su disco del lessico testuale
+    TEXT_CACHE_VERSION = 2
+
+    def __init__(self, model_info, phonetisaurus_binary: Optional[Path] = None,
+                 cache_dir: Optional[Path] = None, lookup_cache_size: Optional[int] = None):
         """Inizializza il wrapper del lessico."""
         self.model_info = model_info
         self.phonetisaurus_binary = phonetisaurus_binary
-        self._cache: Dict[str, Optional[List[List[str]]]] = {}
-        self._word_set: Optional[Set[str]] = None
+        # Directory per la cache del lessico testuale già analizzato (None = disattivata)
+        self.cache_dir = cache_dir
+        # Risultati dei lookup (anche negativi), limitati alle parole usate più di recente
+        self._cache: LRUCache = LRUCache(lookup_cache_size or self.LOOKUP_CACHE_SIZE)
+        # Parole del lessico: vista sulle chiavi di _pronunciations (nessuna tabella hash duplicata)
+        self._word_set: Optional[KeysView] = None
+        # Aperta solo al caricamento: il costruttore non tocca il disco
         self._db_connection: Optional[sqlite3.Connection] = None
-        self._text_pronunciations: Dict[str, List[List[str]]] = {}
-
-        # Inizializza la connessione al database se disponibile
-        if model_info.lexicon_db_path and model_info.lexicon_db_path.exists():
-            try:
-                self._db_connection = sqlite3.connect(str(model_info.lexicon_db_path))
-                _LOGGER.info(f"Connected to lexicon database: {model_info.lexicon_db_path}")
-            except Exception as e:
-                _LOGGER.warning(f"Could not connect to lexicon database: {e}")
-
-    def __del__(self):
-        """Chiude la connessione al database."""
-        if self._db_connection:
-            self._db_connection.close()
+        # Chiude la connessione anche se close() non viene chiamato (rete di sicurezza)
+        self._db_finalizer: Optional[weakref.finalize] = None
+        # Pronunce precaricate in memoria (da file di testo o database), per parola in casefold
+        self._pronunciations: Dict[str, List[Pronunciation]] = {}
+        # Indice BK-tree per parole simili (costruito alla prima ricerca)
+        # Con rapidfuzz bastano le parole ordinate per lunghezza: la scansione avviene in C
+        self._similarity_built = False
+        self._similarity_index: Optional[BKTree] = None
+        self._similarity_choices: List[str] = []
+        # _length_offsets[n] = indice della prima parola lunga almeno n in _similarity_choices
+        self._length_offsets: List[int] = [0]
+        # Statistiche calcolate una volta (il lessico non cambia dopo il caricamento)
+        self._statistics: Optional[Dict[str, any]] = None
+        # Protegge i caricamenti lazy quando usato dal threadpool
+        self._load_lock = threading.RLock()
+
+    def __enter__(self) -> "LexiconWrapper":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Chiude la connessione al database (se ancora aperta)."""
+        with self._load_lock:
+            if self._db_connection is not None:
+                self._db_finalizer()
+                self._db_connection = None
+                self._db_finalizer = None
 
     def exists(self, word: str) -> bool:
         """Verifica se una parola esiste nel lessico."""
@@ -48,69 +96,97 @@ class LexiconWrapper:
         if self._word_set is None:
             self._load_word_set()
 
-        # Controlla le variazioni della parola
-        for word_var in self._word_variations(word):
-            if word_var in self._word_set:
-                return True
-
-        return False
+        # Le parole del lessico sono memorizzate in casefold
+        return word.casefold() in self._word_set
 
-    def lookup(self, word: str) -> List[List[str]]:
+    def lookup(self, word: str) -> List[Pronunciation]:
         """Ottiene le pronunce per una parola."""
-        # Controlla prima la cache
-        if word in self._cache:
-            cached_result = self._cache[word]
-            return cached_result if cached_result is not None else []
-
-        # Cerca nelle variazioni della parola
-        word_vars = list(self._word_variations(word))
-        for word_var in word_vars:
-            cached_prons = self._cache.get(word_var)
-            if cached_prons is not None:
-                self._cache[word] = cached_prons
-                return cached_prons
-
-        # Cerca nei file di testo prima
-        text_prons: List[List[str]] = []
-        for word_var in word_vars:
-            if word_var in self._text_pronunciations:
-                text_prons.extend(self._text_pronunciations[word_var])
-                if text_prons:
-                    self._cache[word] = text_prons
-                    return text_prons
-
-        # Cerca nel database se non trovato nei file di testo
-        db_prons: List[List[str]] = []
-        if self._db_connection:
-            for word_var in word_vars:
-                try:
-                    cursor = self._db_connection.execute(
-                        "SELECT phonemes FROM word_phonemes WHERE word = ? ORDER BY pron_order",
-                        (word_var,),
-                    )
-                    for row in cursor:
-                        db_prons.append(row[0].split())
-
-                    if db_prons:
-                        # Memorizza nella cache e restituisce
-                        self._cache[word_var] = db_prons
-                        self._cache[word] = db_prons
-                        return db_prons
-                except Exception as e:
-                    _LOGGER.debug(f"Database lookup failed for {word_var}: {e}")
-
-        # Nessuna pronuncia trovata
-        self._cache[word] = []
-        return []
+        return self.lookup_many([word])[word]
+
+    def lookup_many(self, words: List[str]) -> Dict[str, List[Pronunciation]]:
+        """Ottiene le pronunce di più parole, interrogando il database in blocco."""
+        if self._word_set is None:
+            self._load_word_set()
+
+        results: Dict[str, List[Pronunciation]] = {}
+        missing: Dict[str, Tuple[str, ...]] = {}
+
+        for word in words:
+            if word in results or word in missing:
+                continue
+
+            # Un solo accesso alle pronunce precaricate, poi la cache dei lookup su database
+            word_key = word.casefold()
+            prons = self._pronunciations.get(word_key)
+            if prons is None:
+                prons = self._cache.get(word_key)
+
+            if prons is not None:
+                results[word] = prons
+            elif self._db_connection is None:
+                # Il database resta aperto solo se il precaricamento non è riuscito
+                results[word] = []
+            else:
+                missing[word] = (word,) if word == word_key else (word, word_key)
+
+        if not missing:
+            return results
+
+        db_prons = self._lookup_in_database(
+            list({word_var for word_vars in missing.values() for word_var in word_vars})
+        )
+        for word, word_vars in missing.items():
+            prons = next((db_prons[word_var] for word_var in word_vars if word_var in db_prons), [])
+            # Memorizza anche l'assenza di pronunce, per chiave in casefold come le pronunce
+            # precaricate: "Luce", "luce" e "LUCE" condividono la stessa voce
+            self._cache[word.casefold()] = prons
+            results[word] = prons
+
+        return results
+
+    def _lookup_in_database(self, word_vars: List[str]) -> Dict[str, List[Pronunciation]]:
+        """Legge le pronunce di più parole con query IN (...) a blocchi."""
+        db_prons: Dict[str, List[Pronunciation]] = {}
+        for start in range(0, len(word_vars), self.LOOKUP_BATCH_SIZE):
+            chunk = word_vars[start:start + self.LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            try:
+                cursor = self._db_connection.execute(
+                    f"SELECT word, phonemes FROM word_phonemes WHERE word IN ({placeholders}) "
+                    "ORDER BY word, pron_order",
+                    chunk,
+                )
+                for db_word, phonemes in cursor:
+                    db_prons.setdefault(db_word, []).append(_split_phonemes(phonemes))
+            except Exception as e:
+                _LOGGER.debug(f"Database lookup failed for {len(chunk)} words: {e}")
+
+        return db_prons
+
+    def preload(self) -> None:
+        """Precarica parole e pronunce in memoria."""
+        if self._word_set is None:
+            self._load_word_set()
 
     def guess_pronunciation(self, word: str) -> Optional[List[str]]:
         """Indovina la pronuncia di una parola usando Phonetisaurus."""
-        if not self.phonetisaurus_binary or not self.model_info.g2p_path:
-            return None
+        return self.guess_pronunciations([word]).get(word)
 
+    @property
+    def can_guess_pronunciations(self) -> bool:
+        """Indica se Phonetisaurus e il modello G2P sono disponibili."""
+        return bool(self.phonetisaurus_binary and self.model_info.g2p_path)
+
+    def guess_pronunciations(self, words: List[str]) -> Dict[str, List[str]]:
+        """Indovina le pronunce di più parole con una sola esecuzione di Phonetisaurus."""
+        if not words or not self.can_guess_pronunciations:
+            return {}
+
+        pending = set(words)
+        guesses = {}
         try:
             with tempfile.NamedTemporaryFile(mode="w+", suffix=".txt", encoding="utf-8") as wordlist_file:
-                wordlist_file.write(word + "\n")
+                wordlist_file.write("\n".join(pending) + "\n")
                 wordlist_file.flush()
 
                 result = subprocess.run(
@@ -126,71 +202,147 @@ class LexiconWrapper:
 
                 if result.returncode == 0:
                     for line in result.stdout.strip().split("\n"):
-                        if line:
-                            parts = line.split()
-                            if len(parts) >= 3 and parts[0] == word:
-                                phonemes = parts[2:]
-                                return phonemes
+                        parts = line.split()
+                        # Tiene solo la prima ipotesi per ciascuna parola
+                        if len(parts) >= 3 and parts[0] in pending and parts[0] not in guesses:
+                            guesses[parts[0]] = parts[2:]
 
         except Exception as e:
-            _LOGGER.warning(f"Failed to guess pronunciation for '{word}': {e}")
+            _LOGGER.warning(f"Failed to guess pronunciation for {len(pending)} words: {e}")
 
-        return None
+        return guesses
 
     def get_word_status(self, word: str) -> Dict[str, any]:
         """Ottiene lo status completo di una parola."""
-        is_known = self.exists(word)
-        pronunciations = self.lookup(word) if is_known else []
-        guessed_pronunciation = None
-
-        if not is_known:
-            guessed_pronunciation = self.guess_pronunciation(word)
+        return self.get_words_status([word])[word]
 
-        return {
-            "word": word,
-            "is_known": is_known,
-            "pronunciations": pronunciations,
-            "guessed_pronunciation": guessed_pronunciation,
-            "model_id": self.model_info.id,
-            "model_type": self.model_info.type.value,
-        }
-
-    def find_similar_words(self, word: str, max_results: int = 5) -> List[Tuple[str, float]]:
-        """Trova parole simili nel lessico."""
+    def get_words_status(self, words: List[str], guess: bool = True) -> Dict[str, Dict[str, any]]:
+        """Ottiene lo status di più parole, indovinando in blocco quelle sconosciute."""
         if self._word_set is None:
             self._load_word_set()
 
-        similar_words = []
-        word_lower = word.lower()
-
-        # Semplice ricerca per similarità basata su substring e lunghezza
-        for known_word in self._word_set:
-            if known_word == word_lower:
+        statuses = {}
+        unknown_words = []
+        for word in words:
+            if word in statuses:
                 continue
 
-            score = self._calculate_similarity(word_lower, known_word.lower())
-            if score > 0.5:  # Soglia di similarità
-                similar_words.append((known_word, score))
+            # Un solo accesso alle pronunce precaricate decide anche se la parola è nota
+            prons = self._pronunciations.get(word.casefold())
+            statuses[word] = {
+                "word": word,
+                "is_known": prons is not None,
+                "pronunciations": prons if prons is not None else [],
+                "guessed_pronunciation": None,
+                "model_id": self.model_info.id,
+                "model_type": self.model_info.type.value,
+            }
+            if prons is None:
+                unknown_words.append(word)
+
+        # Precaricamento non riuscito: le parole mancanti si cercano nel database
+        if unknown_words and self._db_connection is not None:
+            found = {word: prons for word, prons in self.lookup_many(unknown_words).items() if prons}
+            for word, prons in found.items():
+                statuses[word]["is_known"] = True
+                statuses[word]["pronunciations"] = prons
+            unknown_words = [word for word in unknown_words if word not in found]
+
+        if guess and unknown_words:
+            guesses = self.guess_pronunciations(unknown_words)
+            for word in unknown_words:
+                statuses[word]["guessed_pronunciation"] = guesses.get(word)
+
+        return statuses
 
-        # Ordina per score decrescente e prendi i primi max_results
-        similar_words.sort(key=lambda x: x[1], reverse=True)
-        return similar_words[:max_results]
+    def find_similar_words(self, word: str, max_results: int = 5) -> List[Tuple[str, float]]:
+        """Trova parole simili nel lessico."""
+        if not self._similarity_built:
+            self._build_similarity_index()
+
+        word_key = word.casefold()
+        if not word_key:
+            return []
+
+        if self._similarity_index is None:
+            # Score > 0.5 è possibile solo con lunghezza in (L/2, 2L): scarta le altre fasce
+            length = len(word_key)
+            max_offset = len(self._length_offsets) - 1
+            start = self._length_offsets[min(length // 2 + 1, max_offset)]
+            end = self._length_offsets[min(2 * length, max_offset)]
+            candidates = self._similarity_choices[start:end]
+            # Top-k già ordinato da rapidfuzz (+1: la parola stessa può essere nel lessico)
+            scored = extract_most_similar(word_key, candidates, max_results + 1, 0.5)
+        else:
+            # Score > 0.5 implica distanza < len(word_key): limita la ricerca
+            scored = []
+            for known_word, distance in self._similarity_index.find(word_key, len(word_key) - 1):
+                score = 1.0 - (distance / max(len(word_key), len(known_word)))
+                if score > 0.5:  # Soglia di similarità
+                    scored.append((known_word, score))
+
+        similar_words = [(known_word, score) for known_word, score in scored if known_word != word_key]
+
+        # Primi max_results per score decrescente
+        return heapq.nlargest(max_results, similar_words, key=itemgetter(1))
+
+    def _build_similarity_index(self) -> None:
+        """Prepara le parole del lessico per la ricerca di parole simili."""
+        with self._load_lock:
+            if self._similarity_built:
+                return  # Già costruito da un altro thread
+
+            if self._word_set is None:
+                self._load_word_set()
+
+            if HAS_RAPIDFUZZ:
+                # Ogni fascia di lunghezza diventa una slice contigua
+                choices = sorted(self._word_set, key=len)
+                max_length = len(choices[-1]) if choices else 0
+                offsets = [0] * (max_length + 2)
+                for known_word in choices:
+                    offsets[len(known_word) + 1] += 1
+                for length in range(1, len(offsets)):
+                    offsets[length] += offsets[length - 1]
+                self._similarity_choices = choices
+                self._length_offsets = offsets
+            else:
+                # Senza rapidfuzz il BK-tree evita di calcolare la distanza da ogni parola
+                index = BKTree()
+                for known_word in self._word_set:
+                    index.add(known_word)
+                self._similarity_index = index
+
+            self._similarity_built = True
+
+        _LOGGER.debug(f"Built similarity index with {len(self._word_set)} words")
 
     def _load_word_set(self) -> None:
         """Carica l'elenco delle parole dal database o file di testo."""
-        self._word_set = set()
-
-        if self.model_info.lexicon_db_path and self.model_info.lexicon_db_path.exists():
-            if str(self.model_info.lexicon_db_path).endswith('.txt'):
-                # Carica da file di testo (Speech-to-Phrase format)
-                self._load_from_text_file()
+        with self._load_lock:
+            if self._word_set is not None:
+                return  # Già caricato da un altro thread
+
+            # Pubblica le pronunce solo a caricamento completato
+            pronunciations: Dict[str, List[Pronunciation]] = {}
+
+            if self.model_info.lexicon_db_path and self.model_info.lexicon_db_path.exists():
+                if str(self.model_info.lexicon_db_path).endswith('.txt'):
+                    # Carica da file di testo (Speech-to-Phrase format), se possibile dalla cache
+                    if not self._load_from_text_cache(pronunciations):
+                        self._load_from_text_file(pronunciations)
+                        if pronunciations:
+                            self._save_text_cache(pronunciations)
+                else:
+                    # Carica da database SQLite
+                    self._load_from_database(pronunciations)
             else:
-                # Carica da database SQLite
-                self._load_from_database()
-        else:
-            _LOGGER.warning("No lexicon source available for loading words")
+                _LOGGER.warning("No lexicon source available for loading words")
 
-    def _load_from_text_file(self) -> None:
+            self._pronunciations = pronunciations
+            self._word_set = pronunciations.keys()
+
+    def _load_from_text_file(self, pronunciations: Dict[str, List[Pronunciation]]) -> None:
         """Carica parole da file di testo (formato Speech-to-Phrase)."""
         try:
             with open(self.model_info.lexicon_db_path, 'r', encoding='utf-8') as f:
@@ -200,89 +352,117 @@ class LexiconWrapper:
                         # Formato: word phone1 phone2 ...
                         parts = line.split()
                         if parts:
-                            word = parts[0]
-                            phones = parts[1:] if len(parts) > 1 else []
-                            self._word_set.add(word)
+                            word = parts[0].casefold()
+                            phones = tuple(map(sys.intern, parts[1:]))
 
                             # Memorizza la pronuncia
-                            if word not in self._text_pronunciations:
-                                self._text_pronunciations[word] = []
-                            self._text_pronunciations[word].append(phones)
+                            if word not in pronunciations:
+                                pronunciations[word] = []
+                            pronunciations[word].append(phones)
 
-            _LOGGER.info(f"Loaded {len(self._word_set)} words from lexicon text file")
+            _LOGGER.info(f"Loaded {len(pronunciations)} words from lexicon text file")
 
         except Exception as e:
             _LOGGER.error(f"Failed to load words from text file: {e}")
-            self._word_set = set()
+            pronunciations.clear()
 
-    def _load_from_database(self) -> None:
-        """Carica parole da database SQLite."""
-        if not self._db_connection:
-            _LOGGER.warning("No database connection available for loading words")
+    def _text_cache_path(self) -> Optional[Path]:
+        """Percorso della cache del lessico testuale (None se disattivata)."""
+        if self.cache_dir is None:
+            return None
+        return Path(self.cache_dir) / f"{self.model_info.id}.lexicon.pkl"
+
+    def _text_cache_key(self) -> Dict[str, any]:
+        """Identifica il file sorgente: la cache vale solo se non è cambiato."""
+        stat = self.model_info.lexicon_db_path.stat()
+        return {
+            "version": self.TEXT_CACHE_VERSION,
+            "source": str(self.model_info.lexicon_db_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+
+    def _load_from_text_cache(self, pronunciations: Dict[str, List[Pronunciation]]) -> bool:
+        """Carica le pronunce dalla cache su disco, se valida."""
+        cache_path = self._text_cache_path()
+        if cache_path is None or not cache_path.exists():
+            return False
+
+        # Il GC non serve mentre si creano centinaia di migliaia di liste
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+            if cached.get("key") != self._text_cache_key():
+                _LOGGER.debug(f"Lexicon cache is stale: {cache_path}")
+                return False
+            pronunciations.update(cached["pronunciations"])
+        except Exception as e:
+            _LOGGER.warning(f"Could not read lexicon cache {cache_path}: {e}")
+            return False
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        _LOGGER.info(f"Loaded {len(pronunciations)} words from lexicon cache")
+        return True
+
+    def _save_text_cache(self, pronunciations: Dict[str, List[Pronunciation]]) -> None:
+        """Salva le pronunce analizzate per i prossimi avvii."""
+        cache_path = self._text_cache_path()
+        if cache_path is None:
             return
 
         try:
-            cursor = self._db_connection.execute("SELECT DISTINCT word FROM word_phonemes")
-            for row in cursor:
-                self._word_set.add(row[0])
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            data = pickle.dumps(
+                {"key": self._text_cache_key(), "pronunciations": pronunciations},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            # Scrittura atomica: un avvio concorrente non legge mai un file parziale
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+            _LOGGER.debug(f"Saved lexicon cache: {cache_path}")
+        except Exception as e:
+            _LOGGER.warning(f"Could not write lexicon cache {cache_path}: {e}")
+
+    def _load_from_database(self, pronunciations: Dict[str, List[Pronunciation]]) -> None:
+        """Carica parole da database SQLite."""
+        try:
+            self._db_connection = connect_lexicon_db(self.model_info.lexicon_db_path)
+            self._db_finalizer = weakref.finalize(self, self._db_connection.close)
+            _LOGGER.info(f"Connected to lexicon database: {self.model_info.lexicon_db_path}")
+        except Exception as e:
+            _LOGGER.warning(f"Could not connect to lexicon database: {e}")
+            return
 
-            _LOGGER.info(f"Loaded {len(self._word_set)} words from lexicon database")
+        try:
+            # Carica tutte le pronunce in un'unica query invece di una per parola
+            cursor = self._db_connection.execute(
+                "SELECT word, phonemes FROM word_phonemes ORDER BY word, pron_order"
+            )
+            for word, phonemes in cursor:
+                word = word.casefold()
+                if word not in pronunciations:
+                    pronunciations[word] = []
+                pronunciations[word].append(_split_phonemes(phonemes))
+
+            _LOGGER.info(f"Loaded {len(pronunciations)} words from lexicon database")
 
         except Exception as e:
             _LOGGER.error(f"Failed to load words from database: {e}")
-            self._word_set = set()
-
-    def _word_variations(self, word: str) -> List[str]:
-        """Genera variazioni di una parola (case variations)."""
-        variations = [word]
-
-        word_lower = word.lower()
-        if word_lower != word:
-            variations.append(word_lower)
-
-        word_casefold = word.casefold()
-        if word_casefold != word_lower:
-            variations.append(word_casefold)
-
-        word_upper = word.upper()
-        if word_upper != word:
-            variations.append(word_upper)
-
-        return variations
-
-    def _calculate_similarity(self, word1: str, word2: str) -> float:
-        """Calcola la similarità tra due parole (semplice implementazione)."""
-        # Implementazione base usando Levenshtein distance
-        len1, len2 = len(word1), len(word2)
-        if len1 == 0:
-            return 0.0 if len2 > 0 else 1.0
-        if len2 == 0:
-            return 0.0
-
-        # Matrice per dynamic programming
-        dp = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-
-        # Inizializzazione
-        for i in range(len1 + 1):
-            dp[i][0] = i
-        for j in range(len2 + 1):
-            dp[0][j] = j
-
-        # Riempimento della matrice
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                if word1[i - 1] == word2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1]
-                else:
-                    dp[i][j] = 1 + min(dp[i - 1][j], dp[i][j - 1], dp[i - 1][j - 1])
+            pronunciations.clear()
+            return
 
-        # Conversione in score di similarità (0-1)
-        max_len = max(len1, len2)
-        distance = dp[len1][len2]
-        return 1.0 - (distance / max_len)
+        # Tutte le pronunce sono in memoria: la connessione non serve più
+        self.close()
 
     def get_statistics(self) -> Dict[str, any]:
         """Ottiene statistiche sul lessico."""
+        if self._statistics is not None:
+            return self._statistics
+
         if self._word_set is None:
             self._load_word_set()
 
@@ -295,4 +475,5 @@ class LexiconWrapper:
             "database_path": str(self.model_info.lexicon_db_path) if self.model_info.lexicon_db_path else None,
         }
 
+        self._statistics = stats
         return stats
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""Cache LRU a dimensione limitata per i lookup del lessico."""
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LRUCache(OrderedDict):
+    """Dizionario che scarta le voci usate meno di recente oltre maxsize."""
+
+    def __init__(self, maxsize: int):
+        """Inizializza la cache vuota."""
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            pass  # Scartata nel frattempo da un altro thread
+        return value
+
+    def get(self, key, default: Optional[Any] = None):
+        """Restituisce il valore (aggiornandone l'uso) o default."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        # Rimuove e reinserisce: la voce finisce in fondo (usata più di recente)
+        self.pop(key, None)
+        super().__setitem__(key, value)
+        while len(self) > self.maxsize:
+            try:
+                self.popitem(last=False)
+            except KeyError:
+                break
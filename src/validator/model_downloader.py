@@ -6,16 +6,35 @@ Scarica gli stessi modelli che usa Speech-to-Phrase per predizioni accurate.
 import os
 import sqlite3
 import logging
+import aiofiles
 import aiohttp
 import asyncio
 import gzip
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 import hashlib
+import zlib
+
+from .sqlite_utils import connect_lexicon_db
 
 _LOGGER = logging.getLogger(__name__)
 
+# Dimensione massima dei blocchi letti dalla rete durante i download
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Intervallo minimo (secondi) tra due log di avanzamento del download
+PROGRESS_LOG_INTERVAL = 5.0
+
+# Dimensione dei blocchi letti dal disco per l'hash (Python < 3.11)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Numero minimo di parole perché un lessico scaricato sia considerato valido
+MIN_LEXICON_WORDS = 1000
+
+# Le voci duplicate (stessa parola, a meno di maiuscole, e stessa pronuncia) vengono ignorate
+_INSERT_LEXICON_SQL = "INSERT OR IGNORE INTO lexicon (word, pronunciation) VALUES (?, ?)"
+
 
 class SpeechToPhraseModelDownloader:
     """Downloader per modelli Speech-to-Phrase da HuggingFace."""
@@ -49,6 +68,25 @@ class SpeechToPhraseModelDownloader:
         """Inizializza il downloader."""
         self.models_dir = Path(models_dir)
         self.models_dir.mkdir(parents=True, exist_ok=True)
+        # Sessione HTTP condivisa da tutti i download (creata al primo uso)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Restituisce la sessione HTTP condivisa, creandola se necessario."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=60),
+                # Il buffer di lettura (default 64 KiB) limita la dimensione reale dei blocchi
+                read_bufsize=DOWNLOAD_CHUNK_SIZE,
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Chiude la sessione HTTP condivisa."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def get_model_path(self, model_id: str) -> Path:
         """Ottieni il percorso di un modello."""
@@ -71,56 +109,67 @@ class SpeechToPhraseModelDownloader:
 
         return True
 
-    async def download_file(self, url: str, destination: Path, expected_size: Optional[int] = None) -> bool:
-        """Scarica un file da URL."""
+    async def download_file(self, url: str, destination: Path, expected_size: Optional[int] = None,
+                            session: Optional[aiohttp.ClientSession] = None) -> bool:
+        """Scarica un file da URL (di default con la sessione condivisa)."""
         try:
+            if session is None:
+                session = await self._get_session()
+
             _LOGGER.info(f"Downloading {url} to {destination}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        _LOGGER.error(f"Failed to download {url}: HTTP {response.status}")
-                        return False
+            async with session.get(url) as response:
+                if response.status != 200:
+                    _LOGGER.error(f"Failed to download {url}: HTTP {response.status}")
+                    return False
 
-                    # Crea directory padre se non exists
-                    destination.parent.mkdir(parents=True, exist_ok=True)
+                # Crea directory padre se non exists
+                destination.parent.mkdir(parents=True, exist_ok=True)
 
-                    # Scarica con progress tracking
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
+                # Scarica con progress tracking
+                total_size = int(response.headers.get('content-length', 0))
+                downloaded = 0
+                loop = asyncio.get_running_loop()
+                next_log = loop.time() + PROGRESS_LOG_INTERVAL
 
-                    with open(destination, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            f.write(chunk)
-                            downloaded += len(chunk)
+                # Scritture su disco in un thread: l'event loop resta libero
+                async with aiofiles.open(destination, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+                        downloaded += len(chunk)
 
-                            if total_size > 0:
-                                progress = (downloaded / total_size) * 100
-                                if downloaded % (1024 * 1024) == 0:  # Log ogni MB
-                                    _LOGGER.info(f"Download progress: {progress:.1f}%")
+                        # Log a intervalli di tempo, indipendenti dalla velocità della rete
+                        if total_size > 0 and loop.time() >= next_log:
+                            next_log = loop.time() + PROGRESS_LOG_INTERVAL
+                            progress = (downloaded / total_size) * 100
+                            _LOGGER.info(f"Download progress: {progress:.1f}%")
 
-                    _LOGGER.info(f"Successfully downloaded {destination}")
-                    return True
+                _LOGGER.info(f"Successfully downloaded {destination}")
+                return True
 
         except Exception as e:
             _LOGGER.error(f"Error downloading {url}: {e}")
             return False
 
     def calculate_file_hash(self, file_path: Path) -> str:
-        """Calcola hash MD5 di un file per verifica integrità."""
-        hash_md5 = hashlib.md5()
+        """Calcola hash SHA-256 di un file per verifica integrità."""
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: buffer ampio e GIL rilasciato durante l'hash
+                    return hashlib.file_digest(f, "sha256").hexdigest()
+
+                hash_sha256 = hashlib.sha256()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    hash_sha256.update(chunk)
+                return hash_sha256.hexdigest()
         except Exception:
             return ""
 
     def verify_lexicon_db(self, db_path: Path) -> bool:
         """Verifica che il database lessico sia valido."""
         try:
-            conn = sqlite3.connect(str(db_path))
+            conn = connect_lexicon_db(db_path)
             cursor = conn.cursor()
 
             # Verifica struttura tabelle
@@ -131,11 +180,25 @@ class SpeechToPhraseModelDownloader:
                 _LOGGER.error("Lexicon table not found in database")
                 return False
 
-            # Verifica che ci siano dati
-            cursor.execute("SELECT COUNT(*) FROM lexicon")
-            word_count = cursor.fetchone()[0]
+            # Verifica che ci siano dati: il conteggio è salvato nella tabella
+            # meta alla creazione del database
+            row = None
+            if 'meta' in tables:
+                cursor.execute("SELECT value FROM meta WHERE key = 'word_count'")
+                row = cursor.fetchone()
 
-            if word_count < 1000:  # Sanity check
+            if row is not None:
+                word_count = row[0]
+            else:
+                # Database senza meta: la subquery smette di leggere appena
+                # raggiunto il minimo, senza scandire tutta la tabella
+                cursor.execute(
+                    "SELECT COUNT(*) FROM (SELECT 1 FROM lexicon LIMIT ?)", (MIN_LEXICON_WORDS,)
+                )
+                word_count = cursor.fetchone()[0]
+                _LOGGER.debug(f"Lexicon database has no meta table, counted up to {MIN_LEXICON_WORDS} words")
+
+            if word_count < MIN_LEXICON_WORDS:  # Sanity check
                 _LOGGER.error(f"Too few words in lexicon: {word_count}")
                 return False
 
@@ -147,147 +210,131 @@ class SpeechToPhraseModelDownloader:
             _LOGGER.error(f"Error verifying lexicon database: {e}")
             return False
 
-    def create_lexicon_db_from_txt(self, txt_path: Path, db_path: Path) -> bool:
-        """Crea database SQLite dal file di testo del lessico."""
+    @staticmethod
+    def _open_lexicon_db(db_path: Path) -> sqlite3.Connection:
+        """Crea un database lessico vuoto (rimuovendo quello esistente)."""
+        if db_path.exists():
+            _LOGGER.info(f"Removing existing database: {db_path}")
+            db_path.unlink()
+
+        conn = connect_lexicon_db(db_path, write=True)
+        # Tabella organizzata sulla chiave primaria: nessun indice separato su word.
+        # COLLATE NOCASE permette alle query "word = ? COLLATE NOCASE" di usare la chiave
+        conn.execute('''
+            CREATE TABLE lexicon (
+                word TEXT NOT NULL COLLATE NOCASE,
+                pronunciation TEXT NOT NULL,
+                PRIMARY KEY (word, pronunciation)
+            ) WITHOUT ROWID
+        ''')
+        return conn
+
+    @staticmethod
+    def _finish_lexicon_db(conn: sqlite3.Connection) -> None:
+        """Salva il numero di voci nella tabella meta, conferma e chiude il database."""
+        # total_changes conta solo le righe inserite davvero (non quelle ignorate)
+        word_count = conn.total_changes
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER)")
+        conn.execute("INSERT INTO meta VALUES ('word_count', ?)", (word_count,))
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _parse_lexicon_block(data: bytes) -> List[Tuple[str, str]]:
+        """Estrae le voci (parola, pronuncia) da un blocco di righe complete.
+
+        Formato: parola e pronuncia separate dal primo spazio
+        (es. 'casa k a s a'). Lavora sui bytes e decodifica solo parola e
+        pronuncia delle righe valide.
+        """
+        rows = []
+        append = rows.append
+        for line in data.split(b'\n'):
+            word, sep, pronunciation = line.strip().partition(b' ')
+            # Salta righe senza pronuncia, commenti ('#') ed entries non standard
+            if not sep or word[:1] in (b'#', b'<', b'!', b'-'):
+                continue
+            pronunciation = pronunciation.strip()
+            if not pronunciation:
+                continue
+            word = word.decode('utf-8')
+            if len(word) > 1:
+                append((word, pronunciation.decode('utf-8')))
+        return rows
+
+    def _insert_lexicon_block(self, conn: sqlite3.Connection, data: bytes) -> int:
+        """Inserisce le voci valide di un blocco e restituisce quante righe sono state salvate."""
+        rows = self._parse_lexicon_block(data)
+        if not rows:
+            return 0
+        # I duplicati ignorati da INSERT OR IGNORE non contano
+        changes_before = conn.total_changes
+        conn.executemany(_INSERT_LEXICON_SQL, rows)
+        return conn.total_changes - changes_before
+
+    async def stream_lexicon_to_db(self, url: str, db_path: Path) -> Optional[int]:
+        """Scarica il dizionario gzip e lo inserisce nel database senza file intermedi.
+
+        Il database viene costruito in un file temporaneo e spostato su db_path
+        solo a fine costruzione: un download interrotto non lascia un lessico
+        troncato. Restituisce il numero di parole inserite, o None se il
+        download fallisce.
+        """
+        tmp_path = db_path.with_name(db_path.name + ".tmp")
+        conn = None
         try:
-            _LOGGER.info(f"Creating SQLite database from {txt_path}")
-
-            # Verifica che il file esista
-            if not txt_path.exists():
-                _LOGGER.error(f"Dictionary file not found: {txt_path}")
-                return False
-
-            # Controlla dimensione file
-            file_size = txt_path.stat().st_size
-            _LOGGER.info(f"Dictionary file size: {file_size} bytes")
-
-            # Apri file (potrebbe essere compresso)
-            if txt_path.suffix == '.gz':
-                file_opener = lambda: gzip.open(txt_path, 'rt', encoding='utf-8')
-            else:
-                file_opener = lambda: open(txt_path, 'r', encoding='utf-8')
-
-            # Debug: Leggi prime 10 righe per capire il formato
-            _LOGGER.info("Analyzing dictionary file format...")
-            sample_lines = []
-            try:
-                with file_opener() as f:
-                    for i, line in enumerate(f):
-                        if i >= 10:
-                            break
-                        sample_lines.append(repr(line.strip()))
-
-                _LOGGER.info(f"Sample lines from dictionary:")
-                for i, line in enumerate(sample_lines):
-                    _LOGGER.info(f"  Line {i}: {line}")
-            except Exception as e:
-                _LOGGER.error(f"Error reading sample lines: {e}")
-
-            # Crea database SQLite (rimuovi esistente se necessario)
-            if db_path.exists():
-                _LOGGER.info(f"Removing existing database: {db_path}")
-                db_path.unlink()
-
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-
-            # Crea tabella lessico
-            cursor.execute('''
-                CREATE TABLE lexicon (
-                    word TEXT,
-                    pronunciation TEXT
+            session = await self._get_session()
+            _LOGGER.info(f"Streaming {url} into {db_path}")
+
+            async with session.get(url) as response:
+                if response.status != 200:
+                    _LOGGER.error(f"Failed to download {url}: HTTP {response.status}")
+                    return None
+
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = await asyncio.to_thread(self._open_lexicon_db, tmp_path)
+
+                # MAX_WBITS | 32: riconosce l'header gzip
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+                leftover = b""
+                word_count = 0
+
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    data = leftover + decompressor.decompress(chunk)
+                    # Solo righe complete: l'ultima può continuare nel blocco successivo
+                    end = data.rfind(b"\n") + 1
+                    leftover = data[end:]
+                    if end:
+                        word_count += await asyncio.to_thread(
+                            self._insert_lexicon_block, conn, data[:end]
+                        )
+
+                word_count += await asyncio.to_thread(
+                    self._insert_lexicon_block, conn, leftover + decompressor.flush()
                 )
-            ''')
-
-            # Leggi file di testo e inserisci nel database
-            word_count = 0
-            line_count = 0
-            skipped_lines = 0
-
-            with file_opener() as f:
-                for line in f:
-                    line_count += 1
-                    line = line.strip()
-
-                    if not line or line.startswith('#'):
-                        skipped_lines += 1
-                        continue
-
-                    # Prova diversi formati di separazione
-                    parts = None
-
-                    # Formato principale: Single space (basato sui sample logs)
-                    # Esempi dal log: 'abaco ˈa b a k o', 'casa k a s a'
-                    space_idx = line.find(' ')
-                    if space_idx > 0:
-                        word = line[:space_idx].strip()
-                        pronunciation = line[space_idx+1:].strip()
-
-                        # Salta righe con simboli speciali o entries non standard
-                        if (not word.startswith('<') and
-                            not word.startswith('!') and
-                            not word.startswith('-') and
-                            word and pronunciation and
-                            len(word) > 1):
-                            parts = [word, pronunciation]
-
-                    if parts and len(parts) >= 2:
-                        final_word = parts[0].strip()
-                        final_pronunciation = parts[1].strip()
-
-                        if final_word and final_pronunciation:
-                            cursor.execute(
-                                "INSERT INTO lexicon (word, pronunciation) VALUES (?, ?)",
-                                (final_word, final_pronunciation)
-                            )
-                            word_count += 1
-
-                            # Log prima entry come esempio
-                            if word_count == 1:
-                                _LOGGER.info(f"First entry example: '{final_word}' -> '{final_pronunciation}'")
-                    else:
-                        if line_count <= 20:  # Log prime righe problematiche
-                            _LOGGER.warning(f"Could not parse line {line_count}: {repr(line)}")
-
-            # Crea indice per performance
-            cursor.execute("CREATE INDEX idx_word ON lexicon(word)")
-
-            conn.commit()
-            conn.close()
 
-            _LOGGER.info(f"Dictionary parsing complete:")
-            _LOGGER.info(f"  Total lines processed: {line_count}")
-            _LOGGER.info(f"  Lines skipped: {skipped_lines}")
-            _LOGGER.info(f"  Words extracted: {word_count}")
+                await asyncio.to_thread(self._finish_lexicon_db, conn)
+                conn = None
+                os.replace(tmp_path, db_path)
 
-            return word_count > 100  # Sanity check
+            _LOGGER.info(f"Streamed {word_count} words into {db_path}")
+            return word_count
 
         except Exception as e:
-            _LOGGER.error(f"Error creating lexicon database: {e}")
-            import traceback
-            _LOGGER.error(f"Traceback: {traceback.format_exc()}")
-            return False
+            _LOGGER.error(f"Error streaming lexicon from {url}: {e}")
+            return None
+
+        finally:
+            if conn is not None:
+                conn.close()
+            tmp_path.unlink(missing_ok=True)
 
     def create_minimal_test_database(self, db_path: Path) -> bool:
         """Crea database minimale per test quando download fallisce."""
         try:
             _LOGGER.info(f"Creating minimal test database at {db_path}")
 
-            # Rimuovi database esistente se presente
-            if db_path.exists():
-                _LOGGER.info(f"Removing existing database for fresh creation: {db_path}")
-                db_path.unlink()
-
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-
-            # Crea tabella lessico
-            cursor.execute('''
-                CREATE TABLE lexicon (
-                    word TEXT,
-                    pronunciation TEXT
-                )
-            ''')
+            conn = self._open_lexicon_db(db_path)
 
             # Parole italiane comuni per test
             test_words = [
@@ -427,17 +474,8 @@ class SpeechToPhraseModelDownloader:
             ]
 
             # Inserisci parole nel database
-            for word, pronunciation in test_words:
-                cursor.execute(
-                    "INSERT INTO lexicon (word, pronunciation) VALUES (?, ?)",
-                    (word, pronunciation)
-                )
-
-            # Crea indice
-            cursor.execute("CREATE INDEX idx_word ON lexicon(word)")
-
-            conn.commit()
-            conn.close()
+            conn.executemany(_INSERT_LEXICON_SQL, test_words)
+            self._finish_lexicon_db(conn)
 
             _LOGGER.info(f"Created test database with {len(test_words)} Italian words")
             return True
@@ -446,6 +484,18 @@ class SpeechToPhraseModelDownloader:
             _LOGGER.error(f"Error creating minimal test database: {e}")
             return False
 
+    async def _stream_first_available(self, urls: List[str], db_path: Path) -> Optional[int]:
+        """Prova gli URL in ordine fino al primo dizionario scaricato nel database."""
+        for i, url in enumerate(urls):
+            _LOGGER.info(f"Trying URL {i+1}/{len(urls)}: {url}")
+            word_count = await self.stream_lexicon_to_db(url, db_path)
+            if word_count is not None:
+                _LOGGER.info(f"Successfully downloaded from URL {i+1}")
+                return word_count
+            _LOGGER.warning(f"Download failed from URL {i+1}, trying next...")
+
+        return None
+
     async def download_model(self, model_id: str, force_redownload: bool = False) -> bool:
         """Scarica un modello completo."""
         if model_id not in self.AVAILABLE_MODELS:
@@ -461,33 +511,28 @@ class SpeechToPhraseModelDownloader:
 
         _LOGGER.info(f"Downloading model {model_id} to {model_path}")
 
-        # Scarica lexicon text file (compresso) con fallback URLs
-        lexicon_url = model_info["lexicon_txt"]
-        lexicon_txt_path = model_path / "base_dictionary.txt.gz"
-
-        # Lista di URL da provare
-        urls_to_try = [lexicon_url]
+        # Lista di URL da provare per il dizionario (compresso)
+        urls_to_try = [model_info["lexicon_txt"]]
         if "fallback_urls" in model_info:
             urls_to_try.extend(model_info["fallback_urls"])
 
-        download_success = False
-        for i, url in enumerate(urls_to_try):
-            _LOGGER.info(f"Trying URL {i+1}/{len(urls_to_try)}: {url}")
-            if await self.download_file(url, lexicon_txt_path):
-                download_success = True
-                _LOGGER.info(f"Successfully downloaded from URL {i+1}")
-                break
-            else:
-                _LOGGER.warning(f"Download failed from URL {i+1}, trying next...")
+        lexicon_db_path = model_path / "lexicon.db"
+        g2p_gz_path = model_path / "g2p.fst.gz"
+
+        # Lessico e G2P sono indipendenti: scaricati in parallelo sulla sessione condivisa.
+        # Il dizionario viene decompresso e inserito nel database durante il download
+        downloads = [self._stream_first_available(urls_to_try, lexicon_db_path)]
+        if "g2p.fst" in model_info:
+            downloads.append(self.download_file(model_info["g2p.fst"], g2p_gz_path))
+        word_count, *g2p_results = await asyncio.gather(*downloads)
 
-        if not download_success:
+        if word_count is None:
             _LOGGER.error(f"Failed to download lexicon text for {model_id} from all URLs")
+            g2p_gz_path.unlink(missing_ok=True)
             return False
 
-        # Converti in database SQLite
-        lexicon_db_path = model_path / "lexicon.db"
-        if not self.create_lexicon_db_from_txt(lexicon_txt_path, lexicon_db_path):
-            _LOGGER.error(f"Failed to create lexicon database for {model_id}")
+        if word_count <= 100:  # Sanity check
+            _LOGGER.error(f"Failed to create lexicon database for {model_id}: only {word_count} words")
 
             # Fallback: crea database minimo per test
             _LOGGER.info("Creating minimal test database as fallback...")
@@ -502,13 +547,11 @@ class SpeechToPhraseModelDownloader:
             _LOGGER.error(f"Lexicon database verification failed for {model_id}")
             return False
 
-        # Scarica G2P model (opzionale)
+        # Estrai G2P model (opzionale)
         if "g2p.fst" in model_info:
-            g2p_url = model_info["g2p.fst"]
-            g2p_gz_path = model_path / "g2p.fst.gz"
             g2p_extracted_path = model_path / "g2p.fst"
 
-            if await self.download_file(g2p_url, g2p_gz_path):
+            if g2p_results[0]:
                 _LOGGER.info(f"G2P model downloaded for {model_id}")
 
                 # Estrai il file .gz
@@ -525,32 +568,27 @@ class SpeechToPhraseModelDownloader:
             else:
                 _LOGGER.warning(f"G2P model download failed for {model_id} (non-critical)")
 
-        # Cleanup file temporaneo
-        if lexicon_txt_path.exists():
-            lexicon_txt_path.unlink()
+        # Crea file info del modello: gli hash dei file sono calcolati in parallelo,
+        # fuori dall'event loop
+        tracked_files = [lexicon_db_path]
+        g2p_path = model_path / "g2p.fst"
+        if g2p_path.exists():
+            tracked_files.append(g2p_path)
+        hashes = await asyncio.gather(
+            *(asyncio.to_thread(self.calculate_file_hash, path) for path in tracked_files)
+        )
 
-        # Crea file info del modello
         model_info_data = {
             "model_id": model_id,
             "language": model_info["language"],
             "description": model_info["description"],
             "download_date": asyncio.get_event_loop().time(),
             "files": {
-                "lexicon.db": {
-                    "size": lexicon_db_path.stat().st_size,
-                    "hash": self.calculate_file_hash(lexicon_db_path)
-                }
+                path.name: {"size": path.stat().st_size, "sha256": file_hash}
+                for path, file_hash in zip(tracked_files, hashes)
             }
         }
 
-        # Aggiungi info G2P se disponibile
-        g2p_path = model_path / "g2p.fst"
-        if g2p_path.exists():
-            model_info_data["files"]["g2p.fst"] = {
-                "size": g2p_path.stat().st_size,
-                "hash": self.calculate_file_hash(g2p_path)
-            }
-
         info_path = model_path / "model_info.json"
         with open(info_path, 'w') as f:
             json.dump(model_info_data, f, indent=2)
@@ -558,21 +596,26 @@ class SpeechToPhraseModelDownloader:
         _LOGGER.info(f"Successfully downloaded and verified model {model_id}")
         return True
 
-    def get_downloaded_models(self) -> Dict[str, Dict[str, Any]]:
-        """Ottieni lista dei modelli scaricati."""
-        downloaded = {}
+    def _read_model_info(self, model_id: str) -> Optional[Dict[str, Any]]:
+        """Legge model_info.json di un modello scaricato (None se assente o illeggibile)."""
+        if not self.is_model_downloaded(model_id):
+            return None
 
-        for model_id in self.AVAILABLE_MODELS:
-            if self.is_model_downloaded(model_id):
-                info_path = self.get_model_path(model_id) / "model_info.json"
-                try:
-                    with open(info_path) as f:
-                        model_info = json.load(f)
-                    downloaded[model_id] = model_info
-                except Exception as e:
-                    _LOGGER.warning(f"Could not read model info for {model_id}: {e}")
+        info_path = self.get_model_path(model_id) / "model_info.json"
+        try:
+            return json.loads(info_path.read_bytes())
+        except Exception as e:
+            _LOGGER.warning(f"Could not read model info for {model_id}: {e}")
+            return None
 
-        return downloaded
+    async def get_downloaded_models(self) -> Dict[str, Dict[str, Any]]:
+        """Ottieni lista dei modelli scaricati."""
+        # Controlli e letture su disco in thread, in parallelo: l'event loop resta libero
+        model_ids = list(self.AVAILABLE_MODELS)
+        infos = await asyncio.gather(
+            *(asyncio.to_thread(self._read_model_info, model_id) for model_id in model_ids)
+        )
+        return {model_id: info for model_id, info in zip(model_ids, infos) if info is not None}
 
     async def ensure_model_available(self, model_id: str = "it_IT-rhasspy") -> bool:
         """Assicura che un modello sia disponibile, scaricandolo se necessario."""
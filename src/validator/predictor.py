@@ -88,6 +88,11 @@ class SpeechToPhrasePredictor:
         """Verifica se il predictor è inizializzato."""
         return self._lexicon is not None and self._current_model is not None
 
+    @property
+    def current_model_id(self) -> Optional[str]:
+        """ID del modello caricato (None se non inizializzato)."""
+        return self._current_model if self.is_initialized() else None
+
     def _calculate_confidence_level(self, score: float) -> RecognitionConfidence:
         """Calcola livello di confidenza da score numerico."""
         if score >= 0.95:
@@ -120,16 +125,31 @@ class SpeechToPhrasePredictor:
 
     def predict_word(self, word: str) -> WordPrediction:
         """Predici riconoscibilità di una singola parola."""
+        return self.predict_words_bulk([word])[0]
+
+    def predict_words_bulk(self, words: List[str]) -> List[WordPrediction]:
+        """Predici riconoscibilità di più parole con un unico accesso al lessico."""
         if not self.is_initialized():
             raise ValueError("Predictor not initialized")
 
+        try:
+            pronunciations = self._lexicon.get_pronunciations_bulk(words)
+        except Exception as e:
+            _LOGGER.error(f"Error loading pronunciations for {len(words)} words: {e}")
+            pronunciations = {}
+
+        return [
+            self._predict_word(word, pronunciations.get(self._lexicon.normalize_word(word), []))
+            for word in words
+        ]
+
+    def _predict_word(self, word: str, lexicon_pronunciations: List[List[str]]) -> WordPrediction:
+        """Predici riconoscibilità di una parola date le sue pronunce nel lessico."""
         try:
             # Verifica nel lessico
-            in_lexicon = self._lexicon.exists_in_lexicon(word)
-            lexicon_pronunciations = []
+            in_lexicon = bool(lexicon_pronunciations)
 
             if in_lexicon:
-                lexicon_pronunciations = self._lexicon.get_pronunciations(word)
                 confidence_score = 1.0
                 g2p_available = False
                 g2p_pronunciation = None
@@ -202,18 +222,10 @@ class SpeechToPhrasePredictor:
             raise ValueError("Predictor not initialized")
 
         try:
-            # Dividi entità in parole
-            word_components = self._lexicon.validate_word_components(entity_name)
-
-            # Predici ogni parola
-            word_predictions = []
-            total_score = 0.0
-
-            for component in word_components:
-                word = component["word"]
-                word_pred = self.predict_word(word)
-                word_predictions.append(word_pred)
-                total_score += word_pred.confidence_score
+            # Dividi entità in parole e predici tutte le parole in blocco
+            words = self._lexicon.split_entity_words(entity_name)
+            word_predictions = self.predict_words_bulk(words)
+            total_score = sum(wp.confidence_score for wp in word_predictions)
 
             # Calcola score complessivo
             if word_predictions:
@@ -314,7 +326,7 @@ class SpeechToPhrasePredictor:
 
         try:
             lexicon_stats = self._lexicon.get_lexicon_statistics()
-            downloaded_models = self.downloader.get_downloaded_models()
+            downloaded_models = await self.downloader.get_downloaded_models()
 
             return {
                 "current_model": self._current_model,
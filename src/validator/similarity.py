@@ -0,0 +1,137 @@
+"""Funzioni di similarità tra parole e indice per ricerca fuzzy."""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+# rapidfuzz è opzionale: implementazione C++ della distanza di Levenshtein
+try:
+    from rapidfuzz import process as _rapidfuzz_process
+    from rapidfuzz.distance import Levenshtein as _RapidfuzzLevenshtein
+except ImportError:
+    _rapidfuzz_process = None
+    _RapidfuzzLevenshtein = None
+
+HAS_RAPIDFUZZ = _RapidfuzzLevenshtein is not None
+
+
+def _python_levenshtein_distance(word1: str, word2: str) -> int:
+    """Calcola la distanza di Levenshtein tra due parole (Python puro).
+
+    Usa l'algoritmo bit-parallelo di Myers (variante di Hyyrö): una colonna
+    della matrice DP è codificata nei bit di due interi, quindi ogni carattere
+    del testo costa poche operazioni intere invece di un ciclo sul pattern.
+    """
+    if len(word1) < len(word2):
+        word1, word2 = word2, word1
+    length = len(word2)
+    if length == 0:
+        return len(word1)
+
+    # Maschera delle posizioni di ogni carattere nel pattern (la parola più corta)
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(word2):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    vp, vn, distance = mask, 0, length
+    for char in word1:
+        eq = peq.get(char, 0)
+        xv = eq | vn
+        xh = ((((eq & vp) + vp) & mask) ^ vp) | eq
+        hp = vn | (~(xh | vp) & mask)
+        hn = vp & xh
+        if hp & last_bit:
+            distance += 1
+        elif hn & last_bit:
+            distance -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(xv | hp) & mask)
+        vn = hp & xv
+
+    return distance
+
+
+if HAS_RAPIDFUZZ:
+    levenshtein_distance: Callable[[str, str], int] = _RapidfuzzLevenshtein.distance
+else:
+    levenshtein_distance = _python_levenshtein_distance
+
+
+def similarity_score(word1: str, word2: str) -> float:
+    """Converte la distanza di Levenshtein in uno score di similarità (0-1)."""
+    len1, len2 = len(word1), len(word2)
+    if len1 == 0:
+        return 0.0 if len2 > 0 else 1.0
+    if len2 == 0:
+        return 0.0
+
+    return 1.0 - (levenshtein_distance(word1, word2) / max(len1, len2))
+
+
+def extract_most_similar(word: str, choices: List[str], limit: int,
+                         min_score: float) -> List[Tuple[str, float]]:
+    """Restituisce le `limit` parole più simili con score > min_score (richiede rapidfuzz)."""
+    matches = _rapidfuzz_process.extract(
+        word,
+        choices,
+        scorer=_RapidfuzzLevenshtein.normalized_similarity,
+        limit=limit,
+        score_cutoff=min_score,
+    )
+    return [(choice, score) for choice, score, _ in matches if score > min_score]
+
+
+class BKTree:
+    """BK-tree per trovare parole entro una distanza di edit massima."""
+
+    def __init__(self, distance: Callable[[str, str], int] = levenshtein_distance):
+        """Inizializza l'albero vuoto."""
+        self._distance = distance
+        # Ogni nodo è (parola, {distanza: nodo figlio})
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> None:
+        """Aggiunge una parola all'albero."""
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            distance = self._distance(word, node[0])
+            if distance == 0:
+                return
+
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self._size += 1
+                return
+            node = child
+
+    def find(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """Trova le parole a distanza <= max_distance."""
+        if self._root is None:
+            return []
+
+        results = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = self._distance(word, node_word)
+            if distance <= max_distance:
+                results.append((node_word, distance))
+
+            # Disuguaglianza triangolare: visita solo i rami compatibili
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+
+        return results
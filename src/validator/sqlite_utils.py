@@ -0,0 +1,42 @@
+"""Utility per le connessioni SQLite ai database lessicali."""
+
+import sqlite3
+from pathlib import Path
+
+# PRAGMA per le connessioni in lettura: cache di 64 MB, tabelle temporanee
+# in memoria e file mappato in memoria (256 MB)
+READ_PRAGMAS = (
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+)
+
+# PRAGMA aggiuntive per i database che creiamo noi: vengono costruiti da zero
+# e, se la costruzione fallisce, ricreati, quindi journal e fsync non servono
+WRITE_PRAGMAS = (
+    "journal_mode=OFF",
+    "synchronous=OFF",
+)
+
+
+def configure_connection(conn: sqlite3.Connection, write: bool = False) -> sqlite3.Connection:
+    """Applica le PRAGMA di performance a una connessione."""
+    pragmas = READ_PRAGMAS + WRITE_PRAGMAS if write else READ_PRAGMAS
+    for pragma in pragmas:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+
+def connect_lexicon_db(db_path, write: bool = False) -> sqlite3.Connection:
+    """Apre una connessione al database lessicale con le PRAGMA configurate.
+
+    In lettura il database viene aperto in sola lettura e come immutabile:
+    SQLite salta lock e controlli di modifica del file. Le connessioni in
+    lettura non vanno quindi tenute aperte mentre il file viene riscritto.
+    """
+    if write:
+        conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    else:
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro&immutable=1"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    return configure_connection(conn, write=write)
@@ -13,8 +13,14 @@ from typing import List, Optional, Dict, Tuple, Any
 from dataclasses import dataclass
 import json
 
+from .similarity import similarity_score
+from .sqlite_utils import connect_lexicon_db
+
 _LOGGER = logging.getLogger(__name__)
 
+# Tabella per split_entity_words: underscore e trattini diventano spazi
+_ENTITY_SEPARATORS = str.maketrans({"_": " ", "-": " "})
+
 
 @dataclass
 class LexiconEntry:
@@ -35,6 +41,12 @@ class G2PResult:
 class StandaloneLexicon:
     """Manager autonomo per database lessicali Speech-to-Phrase."""
 
+    # Numero massimo di parole per query IN (...)
+    BULK_QUERY_SIZE = 500
+
+    # Candidati estratti dall'indice a trigrammi prima del ranking Levenshtein
+    SIMILAR_CANDIDATES = 100
+
     def __init__(self, model_path: Path):
         """Inizializza il lexicon manager."""
         self.model_path = model_path
@@ -47,6 +59,8 @@ class StandaloneLexicon:
 
         # Connessione database
         self._conn: Optional[sqlite3.Connection] = None
+        # Indice FTS5 a trigrammi (None = non ancora costruito)
+        self._trigram_index: Optional[bool] = None
 
         # Verifica files
         if not self.lexicon_db_path.exists():
@@ -60,7 +74,7 @@ class StandaloneLexicon:
     def _get_connection(self) -> sqlite3.Connection:
         """Ottieni connessione database (lazy loading)."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.lexicon_db_path))
+            self._conn = connect_lexicon_db(self.lexicon_db_path)
             self._conn.row_factory = sqlite3.Row
         return self._conn
 
@@ -69,6 +83,8 @@ class StandaloneLexicon:
         if self._conn:
             self._conn.close()
             self._conn = None
+            # L'indice a trigrammi è una tabella temporanea della connessione
+            self._trigram_index = None
 
     def normalize_word(self, word: str) -> str:
         """Normalizza una parola per lookup nel lessico."""
@@ -151,6 +167,50 @@ class StandaloneLexicon:
         entry = self._load_word_to_cache(normalized_word)
         return entry.pronunciations if entry else []
 
+    def get_pronunciations_bulk(self, words: List[str]) -> Dict[str, List[List[str]]]:
+        """Ottieni le pronunce di più parole con una sola query.
+
+        Restituisce un dict parola normalizzata -> pronunce (solo parole trovate).
+        """
+        normalized_words = {self.normalize_word(word) for word in words}
+        result = {
+            word: self._word_cache[word].pronunciations
+            for word in normalized_words if word in self._word_cache
+        }
+
+        missing = [word for word in normalized_words if word not in result]
+        if not missing:
+            return result
+
+        try:
+            conn = self._get_connection()
+            entries: Dict[str, LexiconEntry] = {}
+
+            # Blocchi sotto il limite di variabili SQLite (999)
+            for start in range(0, len(missing), self.BULK_QUERY_SIZE):
+                batch = missing[start:start + self.BULK_QUERY_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT word, pronunciation FROM lexicon WHERE word COLLATE NOCASE IN ({placeholders})",
+                    batch
+                )
+
+                for row in cursor.fetchall():
+                    key = row['word'].lower()
+                    entry = entries.get(key)
+                    if entry is None:
+                        entry = entries[key] = LexiconEntry(word=row['word'], pronunciations=[])
+                    entry.pronunciations.append(row['pronunciation'].split())
+
+            for key, entry in entries.items():
+                self._word_cache[key] = entry
+                result[key] = entry.pronunciations
+
+        except Exception as e:
+            _LOGGER.error(f"Error loading pronunciations for {len(missing)} words: {e}")
+
+        return result
+
     def predict_with_g2p(self, word: str) -> Optional[G2PResult]:
         """Predici pronuncia usando modello G2P Phonetisaurus."""
         if not self._g2p_available:
@@ -209,12 +269,21 @@ class StandaloneLexicon:
         try:
             conn = self._get_connection()
 
-            # Cerca parole che iniziano con le stesse lettere
-            prefix_query = f"{target_normalized[:2]}%"
-            cursor = conn.execute(
-                "SELECT DISTINCT word FROM lexicon WHERE word LIKE ? COLLATE NOCASE LIMIT 100",
-                (prefix_query,)
-            )
+            trigrams = {target_normalized[i:i + 3] for i in range(len(target_normalized) - 2)}
+            if trigrams and self._ensure_trigram_index():
+                # Candidati che condividono più trigrammi con la parola cercata
+                match_query = " OR ".join('"' + trigram.replace('"', '""') + '"' for trigram in trigrams)
+                cursor = conn.execute(
+                    "SELECT word FROM word_trigrams WHERE word_trigrams MATCH ? ORDER BY rank LIMIT ?",
+                    (match_query, self.SIMILAR_CANDIDATES)
+                )
+            else:
+                # Cerca parole che iniziano con le stesse lettere
+                prefix_query = f"{target_normalized[:2]}%"
+                cursor = conn.execute(
+                    "SELECT DISTINCT word FROM lexicon WHERE word LIKE ? COLLATE NOCASE LIMIT ?",
+                    (prefix_query, self.SIMILAR_CANDIDATES)
+                )
 
             candidates = [row['word'] for row in cursor.fetchall()]
 
@@ -234,41 +303,31 @@ class StandaloneLexicon:
             _LOGGER.error(f"Error finding similar words for '{target_word}': {e}")
             return []
 
+    def _ensure_trigram_index(self) -> bool:
+        """Costruisce una volta l'indice FTS5 a trigrammi delle parole del lessico."""
+        if self._trigram_index is None:
+            try:
+                conn = self._get_connection()
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS temp.word_trigrams "
+                    "USING fts5(word, tokenize='trigram')"
+                )
+                conn.execute("INSERT INTO temp.word_trigrams(word) SELECT DISTINCT word FROM lexicon")
+                conn.commit()
+                self._trigram_index = True
+            except sqlite3.Error as e:
+                # Richiede SQLite >= 3.34 compilato con FTS5
+                _LOGGER.warning(f"Trigram index not available, using prefix search: {e}")
+                self._trigram_index = False
+
+        return self._trigram_index
+
     def _calculate_similarity(self, word1: str, word2: str) -> float:
         """Calcola similarity tra due parole (0-1)."""
-        # Implementazione semplificata di Levenshtein distance
-        if len(word1) == 0:
-            return 0.0 if len(word2) == 0 else 0.0
-        if len(word2) == 0:
+        if len(word1) == 0 or len(word2) == 0:
             return 0.0
 
-        # Matrice per dynamic programming
-        matrix = [[0] * (len(word2) + 1) for _ in range(len(word1) + 1)]
-
-        # Inizializza prima riga e colonna
-        for i in range(len(word1) + 1):
-            matrix[i][0] = i
-        for j in range(len(word2) + 1):
-            matrix[0][j] = j
-
-        # Calcola distanze
-        for i in range(1, len(word1) + 1):
-            for j in range(1, len(word2) + 1):
-                cost = 0 if word1[i-1] == word2[j-1] else 1
-                matrix[i][j] = min(
-                    matrix[i-1][j] + 1,      # deletion
-                    matrix[i][j-1] + 1,      # insertion
-                    matrix[i-1][j-1] + cost  # substitution
-                )
-
-        # Converti distance in similarity
-        max_len = max(len(word1), len(word2))
-        if max_len == 0:
-            return 1.0
-
-        distance = matrix[len(word1)][len(word2)]
-        similarity = 1.0 - (distance / max_len)
-        return max(0.0, similarity)
+        return similarity_score(word1, word2)
 
     def get_lexicon_statistics(self) -> Dict[str, Any]:
         """Ottieni statistiche sul lessico."""
@@ -307,15 +366,16 @@ class StandaloneLexicon:
                 "cache_size": len(self._word_cache)
             }
 
-    def validate_word_components(self, entity_name: str) -> List[Dict[str, Any]]:
-        """Valida i componenti di un nome entità."""
-        # Dividi nome entità in parole
+    def split_entity_words(self, entity_name: str) -> List[str]:
+        """Dividi un nome entità in parole."""
         # Gestisci separatori comuni: underscore, trattini, spazi
-        words = re.split(r'[_\-\s]+', entity_name.lower())
-        words = [w for w in words if w]  # Rimuovi stringhe vuote
+        # split() senza argomenti scarta già le stringhe vuote
+        return entity_name.lower().translate(_ENTITY_SEPARATORS).split()
 
+    def validate_word_components(self, entity_name: str) -> List[Dict[str, Any]]:
+        """Valida i componenti di un nome entità."""
         results = []
-        for word in words:
+        for word in self.split_entity_words(entity_name):
             word_info = {
                 "word": word,
                 "in_lexicon": self.exists_in_lexicon(word),
@@ -186,13 +186,17 @@ def start_application(config):
         logger.info("🔄 Importing application...")
         from api.app import app
 
-        logger.info("🌐 Starting web server on 0.0.0.0:8099...")
+        # Più worker richiedono l'app come import string (ogni processo la reimporta)
+        workers = int(os.getenv("STP_WORKERS", "1"))
+
+        logger.info(f"🌐 Starting web server on 0.0.0.0:8099 ({workers} worker/s)...")
         import uvicorn
 
         uvicorn.run(
-            app,
+            "api.app:app" if workers > 1 else app,
             host="0.0.0.0",
             port=8099,
+            workers=workers,
             log_level=config["log_level"].lower(),
             access_log=True
         )
@@ -229,8 +233,8 @@ def start_application(config):
             logger.info("🔄 Trying ultra-simple HTTP server...")
 
             # Ultra-simple fallback
-            import subprocess
-            subprocess.run([sys.executable, "/app/simple_server.py"])
+            from run_server import run_simple_server
+            run_simple_server()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
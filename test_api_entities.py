@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test dello streaming di /api/validate/entities quando la validazione fallisce a metà."""
+
+import json
+import sys
+from pathlib import Path
+
+# Aggiungi il percorso src al PYTHONPATH
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from fastapi.testclient import TestClient
+
+from api import app as app_module
+from validator import SpeechToPhraseValidator
+from validator.core import EntityValidationResult, ValidationStatus
+
+# Campi di riepilogo che il documento deve sempre contenere
+SUMMARY_KEYS = (
+    "model_id",
+    "total_entities",
+    "known_entities",
+    "unknown_entities",
+    "partially_known_entities",
+    "overall_score",
+    "recommendations",
+)
+
+
+class FailingValidator:
+    """Validatore finto: restituisce due entità e poi solleva un errore."""
+
+    current_model_id = "it_IT-test"
+    summarize_entities = staticmethod(SpeechToPhraseValidator.summarize_entities)
+
+    def has_model(self, model_id):
+        return True
+
+    def iter_entity_results(self, entities, model_id=None):
+        for entity in entities[:2]:
+            yield EntityValidationResult(
+                entity_id=entity,
+                friendly_name=entity,
+                words_results=[],
+                overall_status=ValidationStatus.KNOWN,
+                recommendations=[],
+            )
+        raise RuntimeError("lexicon went away")
+
+
+def test_validate_entities_error_keeps_schema():
+    """Un errore dopo le prime entità chiude comunque un JSON valido con il riepilogo."""
+    app_module.app.dependency_overrides[app_module.require_validator] = FailingValidator
+    try:
+        client = TestClient(app_module.app)
+        response = client.post("/api/validate/entities", json={"entities": ["luce", "tenda", "porta"]})
+    finally:
+        app_module.app.dependency_overrides.clear()
+
+    document = json.loads(response.content)
+    for key in SUMMARY_KEYS:
+        assert key in document, key
+    assert [er["entity_id"] for er in document["entity_results"]] == ["luce", "tenda"]
+    assert document["total_entities"] == 2
+    assert document["model_id"] == "it_IT-test"
+    assert document["overall_status"] == "error"
+    assert document["error"] == "lexicon went away"
+
+
+if __name__ == "__main__":
+    test_validate_entities_error_keeps_schema()
+    print("✅ Test completato con successo!")
@@ -99,7 +99,7 @@ async def test_downloader_only():
             logger.info(f"  - {model_id}: {model_info['description']}")
 
         # Check what's already downloaded
-        downloaded = downloader.get_downloaded_models()
+        downloaded = await downloader.get_downloaded_models()
         logger.info(f"Downloaded models: {list(downloaded.keys())}")
 
         # Test if we can check model status